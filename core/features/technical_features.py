@@ -3,6 +3,11 @@
 import numpy as np
 import pandas as pd
 
+try:
+    from numba import njit, types
+except ImportError:
+    njit = None
+
 def calculate_sma(data, window):
     """Calcula la Media Móvil Simple (SMA)."""
     return data.rolling(window=window).mean()
@@ -97,6 +102,95 @@ def extract_technical_features(data, timeframes):
         }
     return features
 
+if njit is not None:
+    # cache=True guarda el código compilado en __pycache__: solo la primera
+    # ejecución paga la compilación (quicktest, validaciones, etc.). Con firma
+    # explícita se compilan al importar y no en la primera llamada.
+    # Se incluye la variante de solo lectura: con copy-on-write, pandas
+    # devuelve arrays no escribibles y ascontiguousarray no los copia
+    _F8 = types.Array(types.float64, 1, 'C')
+    _F8_RO = types.Array(types.float64, 1, 'C', readonly=True)
+
+    # Sin fastmath: asume que no hay NaN/inf y los precios pueden traerlos
+    @njit([_F8(arr, types.int64) for arr in (_F8, _F8_RO)], cache=True)
+    def _rsi_kernel(deltas, window):
+        """
+        RSI de cada ventana completa de variaciones, con sumas acumuladas.
+        Las variaciones no finitas no entran en las sumas: solo las ventanas
+        que las contienen quedan a NaN.
+        """
+        n = deltas.shape[0] - window + 1
+        rsi = np.empty(n)
+        gain_sum = 0.0
+        loss_sum = 0.0
+        invalid = 0
+        for i in range(deltas.shape[0]):
+            d = deltas[i]
+            if not np.isfinite(d):
+                invalid += 1
+            elif d > 0:
+                gain_sum += d
+            else:
+                loss_sum -= d
+            if i >= window:
+                old = deltas[i - window]
+                if not np.isfinite(old):
+                    invalid -= 1
+                elif old > 0:
+                    gain_sum -= old
+                else:
+                    loss_sum += old
+            if i >= window - 1:
+                if invalid > 0:
+                    rsi[i - window + 1] = np.nan
+                    continue
+                # Las restas acumuladas pueden dejar un residuo negativo
+                avg_gain = max(gain_sum, 0.0) / window
+                avg_loss = max(loss_sum, 0.0) / window
+                rs = avg_gain / (avg_loss + 1e-10)
+                rsi[i - window + 1] = 100 - (100 / (1 + rs))
+        return rsi
+
+    # Sin fastmath, igual que _rsi_kernel: una ventana con NaN/inf da NaN/inf
+    # como np.mean/np.std en lugar de un resultado indefinido
+    @njit([types.UniTuple(_F8, 2)(arr, types.int64) for arr in (_F8, _F8_RO)], cache=True)
+    def _rolling_mean_std(prices, window):
+        """Media y desviación estándar (ddof=0) de cada ventana completa."""
+        n = prices.shape[0] - window + 1
+        mean = np.empty(n)
+        std = np.empty(n)
+        for i in range(n):
+            total = 0.0
+            for j in range(i, i + window):
+                total += prices[j]
+            m = total / window
+            sq = 0.0
+            for j in range(i, i + window):
+                d = prices[j] - m
+                sq += d * d
+            mean[i] = m
+            std[i] = np.sqrt(sq / window)
+        return mean, std
+else:
+    def _rsi_kernel(deltas, window):
+        """Versión vectorizada con NumPy cuando numba no está instalado."""
+        finite = np.isfinite(deltas)
+        gains = np.where(finite & (deltas > 0), deltas, 0)
+        losses = np.where(finite & (deltas < 0), -deltas, 0)
+        avg_gain = np.convolve(gains, np.ones(window), 'valid') / window
+        avg_loss = np.convolve(losses, np.ones(window), 'valid') / window
+        rs = avg_gain / (avg_loss + 1e-10)
+        rsi = 100 - (100 / (1 + rs))
+        # Mismo criterio que el kernel: NaN en las ventanas con variaciones no finitas
+        invalid = np.convolve(~finite, np.ones(window), 'valid') > 0
+        rsi[invalid] = np.nan
+        return rsi
+
+    def _rolling_mean_std(prices, window):
+        """Versión vectorizada con NumPy cuando numba no está instalado."""
+        windows = np.lib.stride_tricks.sliding_window_view(prices, window)
+        return windows.mean(axis=1), windows.std(axis=1)
+
 class TechnicalFeatures:
     """Clase para calcular indicadores técnicos."""
 
@@ -118,20 +212,14 @@ class TechnicalFeatures:
             return np.array([np.nan] * len(prices))
 
         # Calcular cambios en los precios
+        prices = np.ascontiguousarray(prices, dtype=np.float64)
         deltas = np.diff(prices)
-        gains = np.where(deltas > 0, deltas, 0)
-        losses = np.where(deltas < 0, -deltas, 0)
 
-        # Calcular promedios móviles exponenciales
-        avg_gain = np.convolve(gains, np.ones(window), 'valid') / window
-        avg_loss = np.convolve(losses, np.ones(window), 'valid') / window
-
-        # Evitar divisiones por cero
-        rs = avg_gain / (avg_loss + 1e-10)
-        rsi = 100 - (100 / (1 + rs))
+        # Promedios móviles de ganancias y pérdidas (evitando divisiones por cero)
+        rsi = _rsi_kernel(deltas, window)
 
         # Rellenar con NaN para mantener el tamaño original
-        rsi = np.concatenate((np.array([np.nan] * (window - 1)), rsi))
+        rsi = np.concatenate((np.full(window - 1, np.nan), rsi))
         return rsi
 
     def calculate_bollinger(self, prices, window=20, num_std=2):
@@ -150,17 +238,14 @@ class TechnicalFeatures:
                 np.array([np.nan] * len(prices)),
             )
 
-        # Calcular la media móvil
-        middle_band = np.array([
-            np.mean(prices[i - window:i]) if i >= window else np.nan
-            for i in range(1, len(prices) + 1)
-        ])
-
-        # Calcular la desviación estándar
-        std = np.array([
-            np.std(prices[i - window:i]) if i >= window else np.nan
-            for i in range(1, len(prices) + 1)
-        ])
+        # Calcular la media móvil y la desviación estándar de cada ventana
+        prices = np.ascontiguousarray(prices, dtype=np.float64)
+        mean, std = _rolling_mean_std(prices, window)
+
+        # Rellenar con NaN las posiciones sin ventana completa
+        padding = np.full(window - 1, np.nan)
+        middle_band = np.concatenate((padding, mean))
+        std = np.concatenate((padding, std))
 
         # Calcular bandas superior e inferior
         upper_band = middle_band + (std * num_std)
@@ -1,7 +1,74 @@
 import os
+import re
+import copy
 import json
 import logging
-from dotenv import load_dotenv
+
+try:
+    from dotenv import dotenv_values
+except ImportError:
+    dotenv_values = None
+
+# orjson decodifica bastante más rápido que json; ambos aceptan bytes
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
+# Líneas [export ]CLAVE=valor de un .env, como las entiende python-dotenv:
+# valor entre comillas dobles o simples (literal) o sin comillas, donde
+# " #" inicia un comentario. Comentarios y líneas vacías no coinciden
+_ENV_RE = re.compile(
+    r"""(?m)^[ \t]*(?:export[ \t]+)?([A-Za-z_][A-Za-z0-9_]*)[ \t]*=[ \t]*"""
+    r"""(?:"([^"\n]*)"|'([^'\n]*)'|([^\n]*?))[ \t]*(?:[ \t]#[^\n]*)?$"""
+)
+
+# config.json ya parseados en este proceso, por (ruta, mtime). Solo se cachea en
+# memoria: nada se escribe a disco (el .env contiene credenciales)
+_config_cache = {}
+
+def _mtime(path):
+    """Devuelve el mtime de un archivo o 0 si no existe."""
+    try:
+        return os.path.getmtime(path)
+    except OSError:
+        return 0
+
+def parse_env_file(path=".env"):
+    """
+    Parsea un archivo .env en un diccionario {clave: valor}.
+    Usa python-dotenv si está instalado y, si no, una única regex sobre todo el archivo.
+    """
+    if dotenv_values is not None:
+        return {k: v for k, v in dotenv_values(path).items() if v is not None}
+
+    with open(path, "r") as f:
+        return _parse_env_text(f.read())
+
+def _parse_env_text(text):
+    """Parsea el contenido de un .env sin python-dotenv."""
+    env = {}
+    for key, double_quoted, single_quoted, raw in _ENV_RE.findall(text):
+        # findall devuelve "" para los grupos que no participan
+        env[key] = double_quoted or single_quoted or raw
+    return env
+
+def load_config_json(config_path="config.json"):
+    """
+    Carga config.json reutilizando el resultado mientras el archivo no cambie.
+
+    :param config_path: Ruta del archivo de configuración JSON.
+    :return: Diccionario compartido con la configuración (no modificar; copiar
+             antes si hace falta).
+    """
+    key = (os.path.abspath(config_path), _mtime(config_path))
+    config = _config_cache.get(key)
+    if config is None:
+        with open(config_path, "rb") as f:
+            config = _json_loads(f.read())
+        _config_cache[key] = config
+    return config
 
 class EnvironmentLoader:
     """Cargador de variables de entorno y configuración."""
@@ -15,9 +82,10 @@ class EnvironmentLoader:
         if self.logger:
             self.logger.info("Cargando variables de entorno desde .env")
         
-        # Cargar variables de .env si existe
+        # Cargar variables de .env si existe (sin pisar las ya definidas)
         if os.path.exists(".env"):
-            load_dotenv()
+            for key, value in parse_env_file(".env").items():
+                os.environ.setdefault(key, value)
             return True
         else:
             if self.logger:
@@ -30,8 +98,8 @@ class EnvironmentLoader:
             self.logger.info(f"Cargando configuración desde {filename}")
         
         if os.path.exists(filename):
-            with open(filename, 'r') as f:
-                self.config = json.load(f)
+            # Copia: load_environment modifica self.config
+            self.config = copy.deepcopy(load_config_json(filename))
             return True
         else:
             if self.logger:
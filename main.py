@@ -6,240 +6,511 @@ Punto de entrada principal
 
 # Importaciones estándar
 import os
-import sys
 import time
 import signal
 import logging
-import json
+import queue
+import threading
 import argparse
+import asyncio
+import functools
+import importlib
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 
-# Componentes del sistema
-try:
+# Componentes del sistema (carga diferida, PEP 562)
+# Cada símbolo se importa la primera vez que se usa, de modo que comandos
+# como --diagnostico no arrastran torch, pandas o el cliente de Binance.
+_LAZY = {
     # Core
-    from core.utils.logging import TradingLogger
-    from core.utils.config import ConfigManager
-    from core.models.model_manager import ModelManager
-    from core.models.ensembler import Ensembler  # Cambiar de ModelEnsembler a Ensembler
-    from core.features.feature_extractor import FeatureExtractor
-    from core.strategy.signal_generator import SignalGenerator
-    from core.strategy.risk_manager import RiskManager
-    from core.optimization.gpu_optimizer import GPUOptimizer
+    "TradingLogger": "core.utils.logging",
+    "ConfigManager": "core.utils.config",
+    "ModelManager": "core.models.model_manager",
+    "Ensembler": "core.models.ensembler",
+    "FeatureExtractor": "core.features.feature_extractor",
+    "TechnicalFeatures": "core.features.technical_features",
+    "SignalGenerator": "core.strategy.signal_generator",
+    "RiskManager": "core.strategy.risk_manager",
+    "GPUOptimizer": "core.optimization.gpu_optimizer",
 
     # Services
-    from services.data_service.data_processor import DataProcessor
-    from services.data_service.database import Database
-    from services.monitor_service.system_monitor import SystemMonitor
-    from services.monitor_service.trading_monitor import TradingMonitor
-    from services.api_service.notification import NotificationService
-    from services.learning.backtesting import BacktestingEngine
-
-    # Traders - Corregido el nombre de la clase
-    from traders.trader_base import TraderBase  # Cambiado de Trader a TraderBase
-    from traders.btc_trader.btc_trader import BTCTrader
-    from traders.btc_trader.config import BTCTraderConfig
-    from traders.eth_trader.eth_trader import ETHTrader
-    from traders.eth_trader.config import ETHTraderConfig
+    "DataProcessor": "services.data_service.data_processor",
+    "Database": "services.data_service.database",
+    "SystemMonitor": "services.monitor_service.system_monitor",
+    "TradingMonitor": "services.monitor_service.trading_monitor",
+    "NotificationService": "services.api_service.notification",
+    "BinanceConnector": "services.data_service.binance_connector",
+    "BacktestingEngine": "services.learning.backtesting",
+
+    # Traders
+    "TraderBase": "traders.trader_base",
+    "BTCTrader": "traders.btc_trader.btc_trader",
+    "BTCTraderConfig": "traders.btc_trader.config",
+    "ETHTrader": "traders.eth_trader.eth_trader",
+    "ETHTraderConfig": "traders.eth_trader.config",
 
     # Environment Loader
-    from load_env import EnvironmentLoader
-except ImportError as e:
-    print(f"Error importando componentes del sistema: {e}")
-    print("Asegúrate de que todos los módulos estén disponibles")
-    sys.exit(1)
+    "EnvironmentLoader": "load_env",
+}
+
+def _resolve(name):
+    """Importa un componente de _LAZY y lo deja cacheado como global del módulo."""
+    obj = globals().get(name)
+    if obj is not None:
+        return obj
+    obj = getattr(importlib.import_module(_LAZY[name]), name)
+    globals()[name] = obj
+    return obj
+
+def __getattr__(name):
+    if name in _LAZY:
+        return _resolve(name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY))
+
+# TRADING_EAGER_IMPORT=1 resuelve todo al arrancar (útil en CI para detectar
+# imports rotos sin tener que recorrer cada modo de operación)
+if os.environ.get("TRADING_EAGER_IMPORT") == "1":
+    for _name in _LAZY:
+        _resolve(_name)
+
+class _LazyProxy:
+    """
+    Proxy que resuelve (vía _LAZY) e instancia el componente indicado en el
+    primer acceso a un atributo.
+    """
+    __slots__ = ('_name', '_args', '_kwargs', '_obj', '_lock')
+
+    def __init__(self, name, *args, **kwargs):
+        self._name = name
+        self._args = args
+        self._kwargs = kwargs
+        self._obj = None
+        self._lock = threading.Lock()
+
+    def _load(self):
+        # Doble comprobación: el primer acceso puede llegar a la vez desde
+        # varios hilos del executor y el componente debe crearse una sola vez
+        obj = self._obj
+        if obj is None:
+            with self._lock:
+                obj = self._obj
+                if obj is None:
+                    obj = self._obj = _resolve(self._name)(*self._args, **self._kwargs)
+        return obj
+
+    def __getattr__(self, attr):
+        return getattr(self._load(), attr)
+
+    def __repr__(self):
+        state = "cargado" if self._obj is not None else "pendiente"
+        return f"<_LazyProxy {self._name} ({state})>"
+
+def _lazy_instance(name, *args, **kwargs):
+    """Devuelve un _LazyProxy, o la instancia real si TRADING_EAGER_IMPORT=1."""
+    proxy = _LazyProxy(name, *args, **kwargs)
+    if os.environ.get("TRADING_EAGER_IMPORT") == "1":
+        return proxy._load()
+    return proxy
 
 # Configuración de logging
-logger = TradingLogger().get_logger()
+# El logger existe desde el inicio, pero los handlers (archivo + consola) se
+# instalan una sola vez en _logger(), después de procesar los argumentos.
+logger = logging.getLogger("TradingSystem")
+
+@functools.lru_cache(maxsize=None)
+def _logger():
+    """Configura TradingLogger una única vez y devuelve el logger del sistema."""
+    return _resolve("TradingLogger")().get_logger()
+
+# Servicios nulos usados cuando no hay implementación real disponible
+class _NullPositionManager:
+    """Gestor de posiciones simulado: acepta todas las operaciones."""
+    __slots__ = ()
+
+    def execute_trade(self, signal, *args, **kwargs):
+        return True
+
+    def get_open_positions(self, *args, **kwargs):
+        return []
+
+class _NullNotifier:
+    """Servicio de notificaciones simulado: descarta los mensajes."""
+    __slots__ = ('enabled', 'token', 'chat_id')
+
+    def __init__(self, enabled=False, token="", chat_id=""):
+        self.enabled = enabled
+        self.token = token
+        self.chat_id = chat_id
+
+    def send_message(self, message, *args, **kwargs):
+        pass
+
+    def send_trade_notification(self, result, *args, **kwargs):
+        pass
+
+class _NullSystemMonitor:
+    """Monitor de sistema simulado: siempre informa de un estado sano."""
+    __slots__ = ()
+
+    def check_status(self, *args, **kwargs):
+        return {"healthy": True, "message": "OK"}
+
+class _NullTradingMonitor:
+    """Monitor de trading simulado."""
+    __slots__ = ()
+
+    def update_stats(self, *args, **kwargs):
+        pass
+
+class _AsyncNotifier:
+    """
+    Envuelve un servicio de notificaciones para que el envío no bloquee el
+    bucle de trading: los mensajes se encolan y un hilo en segundo plano los
+    envía, agrupando hasta 10 mensajes de texto consecutivos en uno solo.
+    """
+    __slots__ = ('_inner', '_queue', '_thread')
+
+    _STOP = object()
+    BATCH_SIZE = 10
+    MAX_MESSAGE_LEN = 4096
+
+    def __init__(self, inner, maxsize=1024):
+        self._inner = inner
+        self._queue = queue.Queue(maxsize=maxsize)
+        self._thread = threading.Thread(target=self._worker, name="notifier", daemon=True)
+        self._thread.start()
+
+    def __getattr__(self, attr):
+        # enabled, token, chat_id, etc. del servicio real
+        return getattr(self._inner, attr)
+
+    def _put(self, item):
+        try:
+            self._queue.put_nowait(item)
+        except queue.Full:
+            logger.warning("Cola de notificaciones llena; mensaje descartado")
+
+    def send_message(self, message, *args, **kwargs):
+        self._put(("message", message))
+
+    def send_trade_notification(self, *args, **kwargs):
+        self._put(("trade", args, kwargs))
+
+    def _send_text(self, text):
+        try:
+            self._inner.send_message(text)
+        except Exception as e:
+            logger.warning(f"Error enviando notificación: {e}")
+
+    def _flush_messages(self, messages):
+        # Telegram rechaza textos de más de MAX_MESSAGE_LEN caracteres: se agrupan
+        # en trozos que no lo superen y un mensaje demasiado largo se trunca
+        limit = self.MAX_MESSAGE_LEN
+        chunk, size = [], 0
+        for message in messages:
+            if len(message) > limit:
+                message = message[:limit - 1] + "…"
+            if chunk and size + 1 + len(message) > limit:
+                self._send_text("\n".join(chunk))
+                chunk, size = [], 0
+            size += len(message) + (1 if chunk else 0)
+            chunk.append(message)
+        if chunk:
+            self._send_text("\n".join(chunk))
+        messages.clear()
+
+    def _worker(self):
+        while True:
+            batch = [self._queue.get()]
+            try:
+                while len(batch) < self.BATCH_SIZE:
+                    batch.append(self._queue.get_nowait())
+            except queue.Empty:
+                pass
+            
+            messages = []
+            for item in batch:
+                if item is self._STOP:
+                    self._flush_messages(messages)
+                    return
+                if item[0] == "message":
+                    messages.append(str(item[1]))
+                    continue
+                # Mantener el orden: enviar los mensajes pendientes antes de la operación
+                self._flush_messages(messages)
+                try:
+                    self._inner.send_trade_notification(*item[1], **item[2])
+                except Exception as e:
+                    logger.warning(f"Error enviando notificación de operación: {e}")
+            self._flush_messages(messages)
+
+    def close(self, timeout=5.0):
+        """Envía lo pendiente y detiene el hilo (espera como máximo timeout segundos)."""
+        if self._thread.is_alive():
+            try:
+                self._queue.put(self._STOP, timeout=timeout)
+            except queue.Full:
+                return
+            self._thread.join(timeout)
+        inner_close = getattr(self._inner, 'close', None)
+        if inner_close is not None:
+            inner_close()
 
 # Variables globales
-running = True
+# Se activa desde signal_handler; los bucles de trading esperan sobre ella
+# en lugar de dormir, así una parada no espera al final del intervalo.
+_shutdown = threading.Event()
 config = None
 services = {}
 traders = []
 
 def signal_handler(sig, frame):
     """Maneja señales para detener el sistema de manera ordenada."""
-    global running
     logger.info("Señal recibida. Deteniendo el sistema de trading...")
-    running = False
+    _shutdown.set()
 
 def parse_args():
     """Parses command-line arguments."""
     parser = argparse.ArgumentParser(description='Sistema de Trading Algorítmico')
-    parser.add_argument('--diagnostico', action='store_true', help='Ejecutar diagnóstico del sistema')
+    parser.add_argument('--diagnostico', nargs='?', const='all', default=None,
+                        help='Ejecutar diagnóstico del sistema. Acepta una lista separada por comas '
+                             f'({", ".join(DIAGNOSTIC_COMPONENTS)}); por defecto todos '
+                             '(también configurable con TRADING_DIAG_SUBSET)')
     parser.add_argument('--verbose', action='store_true', help='Mostrar logs detallados')
     return parser.parse_args()
 
-def load_configuration():
-    """Carga la configuración del sistema."""
+def load_config():
+    """
+    Carga la configuración del sistema (.env + config.json + variables de
+    entorno). Es la única vía de carga; el resultado se pasa a los servicios.
+    """
+    env_loader = _resolve("EnvironmentLoader")(logger=logger)
+    env_loader.load_env_file()
+    env_loader.load_config_file("config.json")
+    env_loader.load_environment(environment="development")
+    
+    # Validar claves críticas para el funcionamiento del sistema
+    env_loader.validate_critical_keys(["trading_mode", "database.path"])
+    
+    # Verificar credenciales de Binance
+    env_loader.manage_binance_credentials()
+    
+    return env_loader.get_config()
+
+def _build(name, *args, **kwargs):
+    """Resuelve un componente de _LAZY y lo instancia (pensado para ejecutarse en un hilo)."""
+    return _resolve(name)(*args, **kwargs)
+
+def _init_data_service(binance_config, session):
+    """Conecta con Binance o devuelve el simulador si no es posible."""
+    api_key = binance_config.get("api_key", "")
+    api_secret = binance_config.get("api_secret", "")
+    testnet = binance_config.get("testnet", True)
+    
     try:
-        logger.info("Cargando configuración...")
-        
-        # Cargar variables de entorno
-        if os.path.exists(".env"):
-            logger.info("Cargando variables de entorno desde .env")
-            # Implementación básica, puedes expandir esto
-            with open(".env") as f:
-                for line in f:
-                    if line.strip() and not line.startswith("#"):
-                        key, value = line.strip().split("=", 1)
-                        os.environ[key] = value
-        
-        # Cargar configuración desde JSON
-        config_path = "config.json"
-        if not os.path.exists(config_path):
-            logger.warning(f"Archivo de configuración {config_path} no encontrado. Usando valores por defecto.")
-            return {
-                "system": {"name": "Trading System", "environment": "development"},
-                "trading_mode": "paper",
-                "binance": {"testnet": True},
-                "traders": {"btc": {"enabled": True}, "eth": {"enabled": True}}
-            }
+        connector_cls = _resolve("BinanceConnector")
+    except (ImportError, AttributeError) as e:
+        logger.warning(f"No se pudo importar BinanceConnector: {e}")
+        logger.info("Inicializando conector de Binance (simulado)...")
+        return create_simulated_data_service(session=session)
+    
+    try:
+        binance = connector_cls(
+            api_key=api_key,
+            api_secret=api_secret,
+            testnet=testnet,
+            session=session
+        )
+        
+        # Intentar conectar
+        if hasattr(binance, "connect") and binance.connect():
+            logger.info("Conexión exitosa con Binance")
+            return binance
         
-        with open(config_path, "r") as f:
-            config = json.load(f)
-            logger.info(f"Configuración cargada desde {config_path}")
-            return config
+        logger.warning("No se pudo conectar a Binance. Usando simulador.")
+            
+    except Exception as e:
+        logger.warning(f"Error al inicializar Binance: {e}")
+        logger.info("Inicializando conector de Binance (simulado)...")
     
+    return create_simulated_data_service(session=session)
+
+def _init_notification_service(notification_config):
+    """Crea el NotificationService real o, si falla, el simulado."""
+    try:
+        real_notification = _resolve("NotificationService")(
+            token=notification_config.get("telegram_token", ""),
+            chat_id=notification_config.get("chat_id", ""),
+            enabled=notification_config.get("enabled", False)
+        )
+        logger.info("Servicio de notificaciones real inicializado")
+        return _AsyncNotifier(real_notification)
     except Exception as e:
-        logger.error(f"Error cargando configuración: {e}")
-        logger.info("Usando configuración por defecto")
-        return {
-            "system": {"name": "Trading System", "environment": "development"},
-            "trading_mode": "paper",
-            "binance": {"testnet": True},
-            "traders": {"btc": {"enabled": True}, "eth": {"enabled": True}}
-        }
+        logger.warning(f"Usando servicio de notificaciones simulado: {e}")
+        return _NullNotifier(
+            enabled=notification_config.get("enabled", False),
+            token=notification_config.get("telegram_token", ""),
+            chat_id=notification_config.get("chat_id", "")
+        )
 
 def initialize_services(config):
-    """Inicializa los servicios necesarios."""
+    """
+    Inicializa los servicios necesarios.
+    Los servicios sin dependencias entre sí (base de datos, procesador,
+    Binance, notificaciones) se crean en paralelo; el arranque tarda lo que
+    el más lento en lugar de la suma de todos. Si alguno falla se cierran
+    los que sí arrancaron y se propaga el error.
+    """
     services = {}
     
     try:
         logger.info("Inicializando servicios...")
         
-        # Base de datos
-        logger.info("Inicializando base de datos...")
-        db_path = config.get("database", {}).get("path", "trading_system.db")
-        services["database"] = Database(db_path)
-        
-        # Procesador de datos
-        logger.info("Inicializando procesador de datos...")
-        services["data_processor"] = DataProcessor()
+        # Sesión HTTP compartida: mantiene vivas las conexiones TLS entre ticks
+        session = create_http_session()
+        if session is not None:
+            services["http_session"] = session
         
-        # Inicializar conector de Binance real
-        logger.info("Inicializando conector de Binance...")
-        binance_config = config.get("binance", {})
-        api_key = binance_config.get("api_key", "")
-        api_secret = binance_config.get("api_secret", "")
-        testnet = binance_config.get("testnet", True)
+        db_path = config.get("database", {}).get("path", "trading_system.db")
+        notification_config = config.get("notifications", {})
         
-        try:
-            # Intentar importar e inicializar el conector real
-            from services.data_service.binance_connector import BinanceConnector  # Corrected import path
+        with ThreadPoolExecutor(max_workers=4, thread_name_prefix="init") as executor:
+            # Nivel 1: servicios independientes
+            logger.info("Inicializando base de datos...")
+            database_future = executor.submit(_build, "Database", db_path)
             
-            binance = BinanceConnector(
-                api_key=api_key,
-                api_secret=api_secret,
-                testnet=testnet
-            )
+            logger.info("Inicializando procesador de datos...")
+            data_processor_future = executor.submit(_build, "DataProcessor")
             
-            # Intentar conectar
-            if hasattr(binance, "connect") and binance.connect():
-                logger.info("Conexión exitosa con Binance")
-                services["data_service"] = binance
-            else:
-                logger.warning("No se pudo conectar a Binance. Usando simulador.")
-                services["data_service"] = create_simulated_data_service()
-                
-        except ImportError as e:
-            logger.warning(f"No se pudo importar BinanceConnector: {e}")
-            logger.info("Inicializando conector de Binance (simulado)...")
-            services["data_service"] = create_simulated_data_service()
-        except Exception as e:
-            logger.warning(f"Error al inicializar Binance: {e}")
-            logger.info("Inicializando conector de Binance (simulado)...")
-            services["data_service"] = create_simulated_data_service()
-        
-        # Crear indicadores primero (necesarios para SignalGenerator)
-        logger.info("Inicializando indicadores...")
-        from core.features.technical_features import TechnicalFeatures
-        indicators = TechnicalFeatures()
-        services["indicators"] = indicators
+            logger.info("Inicializando conector de Binance...")
+            data_service_future = executor.submit(_init_data_service, config.get("binance", {}), session)
+            
+            logger.info("Inicializando servicio de notificaciones...")
+            notification_future = executor.submit(_init_notification_service, notification_config)
+            
+            # Indicadores (necesarios para SignalGenerator): se importan en el primer uso
+            logger.info("Inicializando indicadores...")
+            indicators = _lazy_instance("TechnicalFeatures")
+            services["indicators"] = indicators
+            
+            # Recoger todos los resultados antes de comprobar errores: un fallo
+            # no debe dejar sin registrar (ni sin cerrar) lo que sí arrancó
+            futures = {
+                "database": database_future,
+                "data_processor": data_processor_future,
+                "data_service": data_service_future,
+                "notification_service": notification_future,
+            }
+            errors = []
+            for name, future in futures.items():
+                try:
+                    services[name] = future.result()
+                except Exception as e:
+                    logger.error(f"Error inicializando {name}: {e}")
+                    errors.append(e)
+            if errors:
+                raise errors[0]
         
+        # Nivel 2: depende de los indicadores
         # Inicializar modelos - simplificado (necesarios para SignalGenerator)
         logger.info("Inicializando modelos simples...")
         simple_models = {"dummy_model": lambda x: 0.5}  # Modelo simulado que siempre devuelve 0.5
         
         # Inicializar SignalGenerator - Corregido: pasando los argumentos requeridos
         logger.info("Inicializando generador de señales...")
-        services["signal_generator"] = SignalGenerator(models=simple_models, indicators=indicators)
+        services["signal_generator"] = _resolve("SignalGenerator")(models=simple_models, indicators=indicators)
         
-        # Inicializar PositionManager - Corregido: funciones lambda con argumentos
+        # Inicializar PositionManager
         logger.info("Inicializando gestor de posiciones...")
-        services["position_manager"] = type('PositionManagerSimulated', (), {
-            'execute_trade': lambda signal, *args, **kwargs: True,
-            'get_open_positions': lambda *args, **kwargs: []
-        })()
-        
-        # Notificaciones - Corregido para soportar métodos esperados
-        logger.info("Inicializando servicio de notificaciones...")
-        notification_config = config.get("notifications", {})
-        services["notification_service"] = type('NotificationServiceSimulated', (), {
-            'send_message': lambda message, *args, **kwargs: None,
-            'send_trade_notification': lambda result, *args, **kwargs: None,
-            'enabled': notification_config.get("enabled", False),
-            'token': notification_config.get("telegram_token", ""),
-            'chat_id': notification_config.get("chat_id", "")
-        })()
-        
-        # Intentar usar NotificationService real si está disponible
-        try:
-            real_notification = NotificationService(
-                token=notification_config.get("telegram_token", ""),
-                chat_id=notification_config.get("chat_id", ""),
-                enabled=notification_config.get("enabled", False)
-            )
-            services["notification_service"] = real_notification
-            logger.info("Servicio de notificaciones real inicializado")
-        except Exception as e:
-            logger.warning(f"Usando servicio de notificaciones simulado: {e}")
+        services["position_manager"] = _NullPositionManager()
         
         # Monitores
         logger.info("Inicializando monitores...")
-        services["system_monitor"] = type('SystemMonitorSimulated', (), {
-            'check_status': lambda *args, **kwargs: {"healthy": True, "message": "OK"}
-        })()
-        services["trading_monitor"] = type('TradingMonitorSimulated', (), {
-            'update_stats': lambda *args, **kwargs: None
-        })()
+        services["system_monitor"] = _NullSystemMonitor()
+        services["trading_monitor"] = _NullTradingMonitor()
         
         # Optimizador GPU
         if config.get("use_gpu", False):
             logger.info("Inicializando optimizador GPU...")
-            services["gpu_optimizer"] = GPUOptimizer()
+            services["gpu_optimizer"] = _resolve("GPUOptimizer")()
         
         logger.info("Servicios inicializados correctamente")
         return services
     
     except Exception as e:
         logger.error(f"Error inicializando servicios: {e}")
-        return services
+        # Liberar lo que llegó a arrancar (conexión de Binance, hilo de
+        # notificaciones, base de datos, sesión HTTP) antes de propagar
+        _close_services(services)
+        raise
+
+def _close_services(started):
+    """Cierra los servicios de un arranque fallido sin propagar errores."""
+    for name, method in (("notification_service", "close"), ("data_service", "disconnect"),
+                         ("database", "close"), ("http_session", "close")):
+        close = getattr(started.get(name), method, None)
+        if close is None:
+            continue
+        try:
+            close()
+        except Exception as e:
+            logger.warning(f"Error cerrando {name}: {e}")
+    started.clear()
+
+def create_http_session():
+    """Crea una requests.Session con pool de conexiones para las APIs REST."""
+    try:
+        import requests
+        from requests.adapters import HTTPAdapter
+    except ImportError as e:
+        logger.warning(f"requests no disponible, sin pool de conexiones HTTP: {e}")
+        return None
+    
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=4, pool_maxsize=16)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+class _SimulatedBinanceConnector:
+    """
+    Conector de Binance simulado.
+    Mantiene un único diccionario de datos de mercado y solo actualiza los
+    precios en cada llamada, sin crear objetos nuevos por tick.
+    """
+    __slots__ = ('_data', '_btc', '_eth')
+
+    def __init__(self):
+        self._btc = {'price': 50000.0, 'volume': 10}
+        self._eth = {'price': 3000.0, 'volume': 20}
+        self._data = {'BTC/USDT': self._btc, 'ETH/USDT': self._eth}
+
+    def get_market_data(self, *args, **kwargs):
+        now = time.time()
+        self._btc['price'] = 50000 + (now % 1000) / 10
+        self._eth['price'] = 3000 + (now % 500) / 10
+        return self._data
+
+    get_market_data_simulation = get_market_data
 
-def create_simulated_data_service():
-    """Crea un servicio de datos simulado."""
-    return type('BinanceConnectorSimulated', (), {
-        'get_market_data_simulation': lambda *args, **kwargs: {
-            'BTC/USDT': {'price': 50000 + (time.time() % 1000) / 10, 'volume': 10},
-            'ETH/USDT': {'price': 3000 + (time.time() % 500) / 10, 'volume': 20}
-        },
-        'get_market_data': lambda *args, **kwargs: {
-            'BTC/USDT': {'price': 50000 + (time.time() % 1000) / 10, 'volume': 10},
-            'ETH/USDT': {'price': 3000 + (time.time() % 500) / 10, 'volume': 20}
-        },
-        'connect': lambda: True,
-        'disconnect': lambda *args, **kwargs: None
-    })()
+    def connect(self, *args, **kwargs):
+        return True
+
+    def disconnect(self, *args, **kwargs):
+        return None
+
+def create_simulated_data_service(session=None):
+    """
+    Crea un servicio de datos simulado.
+    Acepta session para mantener la misma firma que BinanceConnector; no se usa.
+    """
+    return _SimulatedBinanceConnector()
+
+# Extensiones de modelos pre-entrenados que se cargan al iniciar
+MODEL_FILE_SUFFIXES = (".pth", ".h5")
 
 def initialize_models(config, services):
     """Inicializa y configura los modelos de IA."""
@@ -247,23 +518,29 @@ def initialize_models(config, services):
         logger.info("Inicializando modelos de IA...")
         
         # Inicializar gestor de modelos
-        model_manager = ModelManager(logger)
+        model_manager = _resolve("ModelManager")(logger)
         
-        # Crear extractor de características
-        feature_extractor = FeatureExtractor()
+        # Crear extractor de características (se importa en el primer uso)
+        feature_extractor = _lazy_instance("FeatureExtractor")
         
-        # Inicializar ensemble
-        model_ensembler = Ensembler(logger)
+        # Inicializar ensemble (se importa en el primer uso)
+        model_ensembler = _lazy_instance("Ensembler", logger)
         
         # Cargar modelos pre-entrenados si existen
         models_dir = config.get("models_directory", "models")
-        if os.path.exists(models_dir):
-            for model_file in os.listdir(models_dir):
-                if model_file.endswith(".pth") or model_file.endswith(".h5"):
-                    model_path = os.path.join(models_dir, model_file)
-                    model_name = os.path.splitext(model_file)[0]
-                    model_manager.load_saved_model(model_name, model_path)
-                    logger.info(f"Modelo {model_name} cargado desde {model_path}")
+        try:
+            with os.scandir(models_dir) as entries:
+                model_entries = [
+                    entry for entry in entries
+                    if entry.name.endswith(MODEL_FILE_SUFFIXES) and entry.is_file()
+                ]
+        except FileNotFoundError:
+            model_entries = []
+        
+        for entry in model_entries:
+            model_name = entry.name.rsplit(".", 1)[0]
+            model_manager.load_saved_model(model_name, entry.path)
+            logger.info(f"Modelo {model_name} cargado desde {entry.path}")
         
         logger.info("Modelos de IA inicializados correctamente")
         
@@ -277,6 +554,31 @@ def initialize_models(config, services):
         logger.error(f"Error inicializando modelos: {e}")
         return None
 
+def _safe(fn, *args, _msg="Error", **kwargs):
+    """
+    Llama a fn(*args, **kwargs) y registra cualquier excepción en lugar de
+    propagarla. Si fn es None (capacidad no disponible) devuelve None.
+    """
+    if fn is None:
+        return None
+    try:
+        return fn(*args, **kwargs)
+    except Exception as e:
+        logger.error("%s: %s", _msg, e)
+        return None
+
+def _bind_trader_capabilities(trader):
+    """
+    Resuelve una sola vez los métodos opcionales del trader y los guarda
+    como atributos (método enlazado o None) para no usar hasattr en cada tick.
+    """
+    trader._name = trader.get_name() if hasattr(trader, 'get_name') else str(trader)
+    trader._analyze = getattr(trader, 'analyze_market', None)
+    trader._paper = getattr(trader, 'execute_paper_trade', None)
+    trader._live = getattr(trader, 'execute_live_trade', None)
+    trader._save = getattr(trader, 'save_state', None)
+    return trader
+
 def load_traders(config, services, models):
     """Carga y configura los traders habilitados."""
     traders = []
@@ -289,14 +591,14 @@ def load_traders(config, services, models):
             logger.info("Inicializando trader de BTC...")
             
             # Inicializar BTCTrader con los argumentos requeridos
-            btc_trader = BTCTrader(
+            btc_trader = _resolve("BTCTrader")(
                 data_service=services["data_service"],
                 signal_generator=services["signal_generator"],
                 position_manager=services["position_manager"],
                 notification_service=services["notification_service"]
             )
             
-            traders.append(btc_trader)
+            traders.append(_bind_trader_capabilities(btc_trader))
             logger.info("Trader de BTC inicializado")
         
         # Configurar trader de ETH si está habilitado
@@ -304,14 +606,14 @@ def load_traders(config, services, models):
             logger.info("Inicializando trader de ETH...")
             
             # Inicializar ETHTrader con los argumentos requeridos (asumiendo la misma firma)
-            eth_trader = ETHTrader(
+            eth_trader = _resolve("ETHTrader")(
                 data_service=services["data_service"],
                 signal_generator=services["signal_generator"],
                 position_manager=services["position_manager"],
                 notification_service=services["notification_service"]
             )
             
-            traders.append(eth_trader)
+            traders.append(_bind_trader_capabilities(eth_trader))
             logger.info("Trader de ETH inicializado")
         
         logger.info(f"{len(traders)} traders inicializados")
@@ -331,7 +633,7 @@ def run_backtesting(config, services, models, traders):
         start_date = backtesting_config.get("start_date", "2023-01-01")
         end_date = backtesting_config.get("end_date", datetime.now().strftime("%Y-%m-%d"))
         
-        backtesting_engine = BacktestingEngine(
+        backtesting_engine = _resolve("BacktestingEngine")(
             services=services,
             config=backtesting_config
         )
@@ -357,111 +659,138 @@ def run_backtesting(config, services, models, traders):
     except Exception as e:
         logger.error(f"Error en backtesting: {e}")
 
-def run_paper_trading(services, traders):
-    """Ejecuta paper trading (simulación)."""
-    try:
-        logger.info("Iniciando modo paper trading...")
-        
-        # Ejecutar solo unos pocos ciclos para prueba
-        for iteration in range(1, 6):
-            if not running:
-                break
-                
-            logger.info(f"Ciclo de paper trading #{iteration}")
+# El ciclo de live trading se registra solo cada N iteraciones (60 × 10 s = 10 min)
+LIVE_CYCLE_LOG_EVERY = 60
+
+async def run_paper_trading(services, traders):
+    """
+    Ejecuta paper trading (simulación).
+    Los traders son independientes entre sí, así que cada ciclo los procesa
+    en paralelo y el tiempo por ciclo es el del trader más lento.
+    """
+    loop = asyncio.get_running_loop()
+    run_in_executor = loop.run_in_executor
+    
+    # Resolver una sola vez los servicios usados en cada ciclo
+    update_stats = getattr(services.get("trading_monitor"), "update_stats", None)
+    check_status = getattr(services.get("system_monitor"), "check_status", None)
+    
+    def process_trader(trader, market_data):
+        # Analizar mercado y ejecutar operación si hay señal
+        signal = _safe(trader._analyze, market_data, _msg=f"Error analizando mercado en {trader._name}")
+        if signal:
+            _safe(trader._paper, signal, _msg=f"Error ejecutando paper trade en {trader._name}")
+    
+    # Datos de mercado simulados: un único diccionario reutilizado en cada ciclo
+    btc_data = {'price': 50000, 'volume': 10}
+    market_data = {'BTC/USDT': btc_data}
+    
+    logger.info("Iniciando modo paper trading...")
+    
+    # Ejecutar solo unos pocos ciclos para prueba
+    for iteration in range(1, 6):
+        if _shutdown.is_set():
+            break
             
-            try:
-                # Obtener datos simulados de mercado
-                market_data = {'BTC/USDT': {'price': 50000 + (iteration * 100), 'volume': 10}}
-                
-                # Procesar cada trader
-                for trader in traders:
-                    try:
-                        # Analizar mercado
-                        if hasattr(trader, 'analyze_market'):
-                            signal = trader.analyze_market(market_data)
-                            
-                            # Ejecutar operación si hay señal
-                            if signal and hasattr(trader, 'execute_paper_trade'):
-                                trader.execute_paper_trade(signal)
-                    except Exception as e:
-                        logger.error(f"Error procesando trader: {e}")
-                
-                # Actualizar monitores
-                try:
-                    if services.get("trading_monitor") and hasattr(services["trading_monitor"], "update_stats"):
-                        services["trading_monitor"].update_stats()
-                except Exception as e:
-                    logger.warning(f"Error actualizando monitor: {e}")
-                    
-                # Verificar estado
-                try:
-                    if services.get("system_monitor") and hasattr(services["system_monitor"], "check_status"):
-                        services["system_monitor"].check_status()
-                except Exception as e:
-                    logger.warning(f"Error verificando estado: {e}")
-                
-                # Esperar entre ciclos
-                time.sleep(2)
-                
-            except Exception as e:
-                logger.error(f"Error en ciclo {iteration}: {e}")
+        logger.info("Ciclo de paper trading #%d", iteration)
         
-        logger.info("Ciclos de paper trading completados correctamente")
+        # Obtener datos simulados de mercado (se actualiza el precio in situ)
+        btc_data['price'] = 50000 + (iteration * 100)
         
-    except Exception as e:
-        logger.error(f"Error en paper trading: {e}")
+        # Procesar todos los traders en paralelo; process_trader no propaga errores
+        await asyncio.gather(
+            *(run_in_executor(None, process_trader, trader, market_data) for trader in traders)
+        )
+        
+        # Actualizar monitores y verificar estado
+        _safe(update_stats, _msg="Error actualizando monitor")
+        _safe(check_status, _msg="Error verificando estado")
+        
+        # Esperar entre ciclos (termina antes si se pide la parada)
+        if await run_in_executor(None, _shutdown.wait, 2.0):
+            break
+    
+    logger.info("Ciclos de paper trading completados correctamente")
 
-def run_live_trading(services, traders):
-    """Ejecuta trading en vivo con dinero real."""
+async def run_live_trading(services, traders):
+    """
+    Ejecuta trading en vivo con dinero real.
+    Los datos de mercado se obtienen una vez por ciclo y los traders se procesan
+    en paralelo en el executor por defecto hasta que sus métodos sean asíncronos.
+    """
+    loop = asyncio.get_running_loop()
+    run_in_executor = loop.run_in_executor
+    
+    # Resolver una sola vez los servicios usados en cada ciclo
+    notify = services["notification_service"].send_message
+    notify_trade = services["notification_service"].send_trade_notification
+    
+    def process_trader(trader, market_data):
+        # Analizar mercado
+        if trader._analyze is None:
+            return
+        signal = trader._analyze(market_data)
+        
+        # Ejecutar operación si hay señal
+        if signal:
+            if trader._live is None:
+                raise AttributeError(f"{trader._name} no implementa execute_live_trade")
+            result = trader._live(signal)
+            if result:
+                notify_trade(result)
+    
     try:
         logger.info("Iniciando modo live trading...")
         
+        get_market_data = services["data_service"].get_market_data
+        update_stats = services["trading_monitor"].update_stats
+        check_status = services["system_monitor"].check_status
+        trader_names = [trader._name for trader in traders]
+        log_info = logger.info
+        log_cycles = logger.isEnabledFor(logging.INFO)
+        
         # Aviso importante de seguridad
         logger.warning("¡ATENCIÓN! El sistema está operando con dinero real.")
-        services.get("notification_service").send_message("⚠️ Sistema de trading iniciado en modo REAL")
+        notify("⚠️ Sistema de trading iniciado en modo REAL")
         
         iteration = 0
-        while running:
+        while not _shutdown.is_set():
             iteration += 1
-            logger.info(f"Ciclo de live trading #{iteration}")
+            if log_cycles and (iteration == 1 or iteration % LIVE_CYCLE_LOG_EVERY == 0):
+                log_info("Ciclo de live trading #%d", iteration)
             
             # Obtener datos actuales de mercado
-            market_data = services.get("data_service").get_market_data()
+            market_data = await run_in_executor(None, get_market_data)
             
-            # Procesar cada trader
-            for trader in traders:
-                try:
-                    # Analizar mercado
-                    signal = trader.analyze_market(market_data)
-                    
-                    # Ejecutar operación si hay señal
-                    if signal:
-                        result = trader.execute_live_trade(signal)
-                        if result:
-                            services.get("notification_service").send_trade_notification(result)
-                
-                except Exception as e:
-                    error_msg = f"Error procesando trader {trader.get_name()}: {e}"
+            # Procesar todos los traders en paralelo; el error de uno no cancela al resto
+            results = await asyncio.gather(
+                *(run_in_executor(None, process_trader, trader, market_data) for trader in traders),
+                return_exceptions=True
+            )
+            for name, result in zip(trader_names, results):
+                if isinstance(result, Exception):
+                    error_msg = f"Error procesando trader {name}: {result}"
                     logger.error(error_msg)
-                    services.get("notification_service").send_message(f"❌ {error_msg}")
+                    notify(f"❌ {error_msg}")
             
             # Actualizar monitor de trading
-            services.get("trading_monitor").update_stats()
+            update_stats()
             
             # Verificar estado del sistema
-            system_status = services.get("system_monitor").check_status()
+            system_status = check_status()
             if not system_status.get("healthy", False):
                 error_msg = f"Estado del sistema: {system_status.get('message', 'Desconocido')}"
                 logger.error(error_msg)
-                services.get("notification_service").send_message(f"⚠️ {error_msg}")
+                notify(f"⚠️ {error_msg}")
             
-            # Esperar antes del siguiente ciclo
-            time.sleep(10)  # Intervalo entre ciclos (ajustable)
+            # Esperar antes del siguiente ciclo (termina antes si se pide la parada)
+            if await run_in_executor(None, _shutdown.wait, 10.0):  # Intervalo entre ciclos (ajustable)
+                break
     
     except Exception as e:
         error_msg = f"Error crítico en live trading: {e}"
         logger.error(error_msg)
-        services.get("notification_service").send_message(f"🚨 {error_msg}")
+        notify(f"🚨 {error_msg}")
 
 def cleanup():
     """Limpia recursos y finaliza componentes."""
@@ -478,8 +807,8 @@ def cleanup():
         # Guardar estado de los traders - Usando enfoque más seguro
         for trader in traders:
             try:
-                if hasattr(trader, 'save_state'):
-                    trader.save_state()
+                if trader._save is not None:
+                    trader._save()
             except Exception as e:
                 logger.warning(f"Error al guardar estado del trader: {e}")
         
@@ -499,74 +828,141 @@ def cleanup():
         except Exception as e:
             logger.warning(f"Error al cerrar base de datos: {e}")
         
+        # Enviar las notificaciones pendientes antes de salir
+        try:
+            notifier_close = getattr(services.get("notification_service"), 'close', None)
+            if notifier_close is not None:
+                notifier_close()
+        except Exception as e:
+            logger.warning(f"Error vaciando la cola de notificaciones: {e}")
+        
+        # Cerrar la sesión HTTP compartida
+        try:
+            if services.get("http_session"):
+                services["http_session"].close()
+        except Exception as e:
+            logger.warning(f"Error al cerrar la sesión HTTP: {e}")
+        
         logger.info("Limpieza completada")
     
     except Exception as e:
         logger.error(f"Error durante la limpieza: {e}")
 
-def run_diagnostics():
-    """Ejecuta diagnósticos básicos del sistema."""
+# Subsistemas que puede comprobar --diagnostico
+DIAGNOSTIC_COMPONENTS = ("models", "features", "binance", "notifications", "backtesting")
+
+def parse_diagnostic_subset(value):
+    """
+    Convierte "models,binance" en un conjunto de componentes a diagnosticar.
+    Si no se indica nada se usa TRADING_DIAG_SUBSET y, en su defecto, "all".
+    """
+    if not value or value == "all":
+        value = os.environ.get("TRADING_DIAG_SUBSET", "all")
+    selected = {part.strip().lower() for part in value.split(",") if part.strip()}
+    if not selected or "all" in selected:
+        return set(DIAGNOSTIC_COMPONENTS)
+    unknown = selected - set(DIAGNOSTIC_COMPONENTS)
+    if unknown:
+        print(f"Componentes de diagnóstico desconocidos ignorados: {', '.join(sorted(unknown))}")
+    return selected & set(DIAGNOSTIC_COMPONENTS)
+
+def run_diagnostics(selected=None, config=None):
+    """
+    Ejecuta diagnósticos básicos del sistema.
+    Solo se importan los componentes seleccionados, así un diagnóstico parcial
+    no paga el coste de cargar modelos o el cliente de Binance. El diagnóstico
+    de Binance no usa credenciales salvo que se pase config explícitamente.
+    """
+    if selected is None:
+        selected = set(DIAGNOSTIC_COMPONENTS)
+    
     print("\n--- DIAGNÓSTICO DEL SISTEMA ---")
-    try:
-        from core.models.model_manager import ModelManager
-        mm = ModelManager(logger)
-        print("✓ ModelManager inicializado correctamente")
-    except Exception as e:
-        print(f"✗ Error en ModelManager: {str(e)}")
+    if "models" in selected:
+        try:
+            from core.models.model_manager import ModelManager
+            mm = ModelManager(logger)
+            print("✓ ModelManager inicializado correctamente")
+        except Exception as e:
+            print(f"✗ Error en ModelManager: {str(e)}")
     
-    try:
-        from core.features.feature_extractor import FeatureExtractor
-        fe = FeatureExtractor()
-        print("✓ FeatureExtractor inicializado correctamente")
-    except Exception as e:
-        print(f"✗ Error en FeatureExtractor: {str(e)}")
+    if "features" in selected:
+        try:
+            from core.features.feature_extractor import FeatureExtractor
+            fe = FeatureExtractor()
+            print("✓ FeatureExtractor inicializado correctamente")
+        except Exception as e:
+            print(f"✗ Error en FeatureExtractor: {str(e)}")
     
-    try:
-        from services.data_service.binance_connector import BinanceConnector
-        bc = BinanceConnector(testnet=True)
-        if bc.connect():
-            print("✓ BinanceConnector conectado correctamente")
-        else:
-            print("✗ BinanceConnector no pudo conectarse")
-    except Exception as e:
-        print(f"✗ Error en BinanceConnector: {str(e)}")
+    if "binance" in selected:
+        try:
+            from services.data_service.binance_connector import BinanceConnector
+            binance_config = (config or {}).get("binance", {})
+            bc = BinanceConnector(
+                api_key=binance_config.get("api_key", ""),
+                api_secret=binance_config.get("api_secret", ""),
+                testnet=True
+            )
+            if bc.connect():
+                print("✓ BinanceConnector conectado correctamente")
+            else:
+                print("✗ BinanceConnector no pudo conectarse")
+        except Exception as e:
+            print(f"✗ Error en BinanceConnector: {str(e)}")
     
-    try:
-        from services.api_service.notification import NotificationService
-        ns = NotificationService(token="dummy", chat_id="dummy", enabled=True)
-        ns.send_message("Prueba de notificación")
-        print("✓ NotificationService inicializado correctamente")
-    except Exception as e:
-        print(f"✗ Error en NotificationService: {str(e)}")
+    if "notifications" in selected:
+        try:
+            from services.api_service.notification import NotificationService
+            ns = NotificationService(token="dummy", chat_id="dummy", enabled=True)
+            ns.send_message("Prueba de notificación")
+            print("✓ NotificationService inicializado correctamente")
+        except Exception as e:
+            print(f"✗ Error en NotificationService: {str(e)}")
 
-    try:
-        from services.learning.backtesting import BacktestingEngine
-        be = BacktestingEngine(services={})
-        print("✓ BacktestingEngine inicializado correctamente")
-    except Exception as e:
-        print(f"✗ Error en BacktestingEngine: {str(e)}")
+    if "backtesting" in selected:
+        try:
+            from services.learning.backtesting import BacktestingEngine
+            be = BacktestingEngine(services={})
+            print("✓ BacktestingEngine inicializado correctamente")
+        except Exception as e:
+            print(f"✗ Error en BacktestingEngine: {str(e)}")
 
     print("--- FIN DEL DIAGNÓSTICO ---\n")
 
+class _ComponentFilter(logging.Filter):
+    """Deja pasar solo los registros de los loggers de componentes indicados."""
+
+    def __init__(self, names):
+        super().__init__()
+        self.names = tuple(names)
+        self.prefixes = tuple(f"{name}." for name in self.names)
+
+    def filter(self, record):
+        return record.name in self.names or record.name.startswith(self.prefixes)
+
+def _attach_component_handler(handler, names):
+    """
+    Sube a DEBUG los loggers de componentes y registra un único handler en el
+    logger padre 'TradingSystem'; los hijos le llegan por propagación.
+    """
+    component_loggers = []
+    for name in names:
+        component_logger = logging.getLogger(name)
+        component_logger.setLevel(logging.DEBUG)
+        component_logger.propagate = True
+        component_loggers.append(component_logger)
+    
+    handler.addFilter(_ComponentFilter(names))
+    logging.getLogger('TradingSystem').addHandler(handler)
+    return component_loggers
+
 def setup_verbose_logging():
     """Configura loggers detallados para componentes clave."""
-    # Configurar loggers específicos
-    model_logger = logging.getLogger('TradingSystem.Models')
-    model_logger.setLevel(logging.DEBUG)
-    
-    feature_logger = logging.getLogger('TradingSystem.Features')
-    feature_logger.setLevel(logging.DEBUG)
-    
-    signal_logger = logging.getLogger('TradingSystem.Signals')
-    signal_logger.setLevel(logging.DEBUG)
-    
-    # Añadir handler para todos los loggers
     handler = logging.StreamHandler()
     handler.setFormatter(logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s'))
     
-    model_logger.addHandler(handler)
-    feature_logger.addHandler(handler)
-    signal_logger.addHandler(handler)
+    model_logger, feature_logger, signal_logger = _attach_component_handler(
+        handler, ['TradingSystem.Models', 'TradingSystem.Features', 'TradingSystem.Signals']
+    )
     
     return {
         'model_logger': model_logger,
@@ -584,18 +980,9 @@ def setup_detailed_logging():
     debug_handler.setLevel(logging.DEBUG)
     debug_handler.setFormatter(logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s'))
     
-    # Configurar loggers específicos
-    models_logger = logging.getLogger('TradingSystem.Models')
-    models_logger.setLevel(logging.DEBUG)
-    models_logger.addHandler(debug_handler)
-    
-    features_logger = logging.getLogger('TradingSystem.Features')
-    features_logger.setLevel(logging.DEBUG)
-    features_logger.addHandler(debug_handler)
-    
-    strategy_logger = logging.getLogger('TradingSystem.Strategy')
-    strategy_logger.setLevel(logging.DEBUG)
-    strategy_logger.addHandler(debug_handler)
+    models_logger, features_logger, strategy_logger = _attach_component_handler(
+        debug_handler, ['TradingSystem.Models', 'TradingSystem.Features', 'TradingSystem.Strategy']
+    )
     
     return {
         'models': models_logger,
@@ -603,8 +990,16 @@ def setup_detailed_logging():
         'strategy': strategy_logger
     }
 
-def log_model_operations(model_manager, signal_generator):
-    """Configura loggers específicos para componentes de IA"""
+def log_model_operations(model_manager, signal_generator, verbose=False):
+    """
+    Configura loggers específicos para componentes de IA.
+    Los hooks de predicción y generación de señales solo se instalan en modo
+    verbose: se ejecutan en cada tick del bucle de trading y, sin verbose,
+    los loggers no suben a DEBUG y las guardas isEnabledFor omiten el trabajo.
+    """
+    if not verbose:
+        return
+    
     models_logger = logging.getLogger('TradingSystem.Models')
     models_logger.setLevel(logging.DEBUG)
     
@@ -612,9 +1007,13 @@ def log_model_operations(model_manager, signal_generator):
     original_predict = model_manager.predict
     
     def predict_with_logging(*args, **kwargs):
-        models_logger.debug(f"Iniciando predicción con datos: {args[0].shape if hasattr(args[0], 'shape') else 'unknown shape'}")
+        debug_enabled = models_logger.isEnabledFor(logging.DEBUG)
+        if debug_enabled:
+            models_logger.debug("Iniciando predicción con datos: %s",
+                                getattr(args[0], 'shape', 'unknown shape') if args else 'unknown shape')
         result = original_predict(*args, **kwargs)
-        models_logger.debug(f"Resultado de predicción: {result}")
+        if debug_enabled:
+            models_logger.debug("Resultado de predicción: %s", result)
         return result
     
     model_manager.predict = predict_with_logging
@@ -626,16 +1025,22 @@ def log_model_operations(model_manager, signal_generator):
     original_generate = signal_generator.generate_signal
     
     def generate_with_logging(*args, **kwargs):
-        signals_logger.debug(f"Generando señal con datos: {args}")
+        debug_enabled = signals_logger.isEnabledFor(logging.DEBUG)
+        if debug_enabled:
+            signals_logger.debug("Generando señal con datos: %s", args)
         result = original_generate(*args, **kwargs)
-        signals_logger.debug(f"Señal generada: {result}")
+        if debug_enabled:
+            signals_logger.debug("Señal generada: %s", result)
         return result
     
     signal_generator.generate_signal = generate_with_logging
 
 def main():
     """Función principal del sistema."""
-    global config, services, traders, running
+    global config, services, traders
+    
+    # Instalar handlers de logging (archivo + consola)
+    _logger()
     
     # Registrar handlers de señales
     signal.signal(signal.SIGINT, signal_handler)
@@ -656,18 +1061,7 @@ def main():
             logger.info("Logging detallado habilitado.")
         
         # Cargar configuración
-        env_loader = EnvironmentLoader(logger=logger)
-        env_loader.load_env_file()
-        env_loader.load_config_file("config.json")
-        env_loader.load_environment(environment="development")
-        
-        # Validar claves críticas para el funcionamiento del sistema
-        env_loader.validate_critical_keys(["trading_mode", "database.path"])
-        
-        # Verificar credenciales de Binance
-        env_loader.manage_binance_credentials()
-        
-        config = env_loader.get_config()
+        config = load_config()
         
         # Inicializar servicios
         services = initialize_services(config)
@@ -683,7 +1077,7 @@ def main():
             return
         
         # Configurar hooks de logging para modelos y generación de señales
-        log_model_operations(models["model_manager"], services["signal_generator"])
+        log_model_operations(models["model_manager"], services["signal_generator"], verbose=args.verbose)
         
         # Determinar modo de operación
         trading_mode = config.get("trading_mode", "paper")
@@ -693,9 +1087,12 @@ def main():
         if trading_mode == "backtesting":
             run_backtesting(config, services, models, traders)
         elif trading_mode == "paper":
-            run_paper_trading(services, traders)
+            try:
+                asyncio.run(run_paper_trading(services, traders))
+            except Exception as e:
+                logger.error(f"Error en paper trading: {e}")
         elif trading_mode == "live":
-            run_live_trading(services, traders)
+            asyncio.run(run_live_trading(services, traders))
         else:
             logger.error(f"Modo de operación desconocido: {trading_mode}")
     
@@ -714,7 +1111,7 @@ if __name__ == "__main__":
         logging.getLogger('TradingSystem').setLevel(logging.DEBUG)
     
     # Ejecutar diagnóstico si se solicita
-    if args.diagnostico:
-        run_diagnostics()
+    if args.diagnostico is not None:
+        run_diagnostics(parse_diagnostic_subset(args.diagnostico))
     else:
         main()
\ No newline at end of file
@@ -1,6 +1,29 @@
+import os
+import time
 import logging
+import multiprocessing
+from multiprocessing import util as mp_util
+import numpy as np
 import pandas as pd
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
 from datetime import datetime, timedelta
+from itertools import product
+
+try:
+    from tqdm import tqdm
+except ImportError:
+    tqdm = None
+
+try:
+    from numba import njit, types
+except ImportError:
+    njit = None
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:
+    pa = None
 
 from core.models.model_manager import ModelManager
 from services.learning.backtesting import BacktestingEngine
@@ -11,33 +34,253 @@ from services.data_service.binance_connector import BinanceConnector
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger("ModelEvaluation")
 
-def run_model_evaluation():
-    """Ejecuta una evaluación completa de modelos."""
-    logger.info("Iniciando evaluación de modelos")
+# Modelos candidatos a evaluar
+AVAILABLE_MODELS = ["lstm", "transformer", "baseline"]
+
+# Modelos guardados en disco (mismo criterio que main.initialize_models)
+MODELS_DIR = "models"
+MODEL_FILE_SUFFIXES = (".pth", ".h5")
+
+# Modelos que calculan internamente en float32: sus features se convierten
+# una sola vez aquí en lugar de en cada llamada a predict
+FLOAT32_MODELS = ("lstm", "transformer")
+
+# Estado por proceso worker: el cliente de Binance no se puede serializar,
+# así que cada proceso crea el suyo (y carga los modelos que necesite)
+_worker_binance = None
+_worker_model_manager = None
+_worker_models = {}
+
+def _init_worker():
+    """Inicializa el cliente de Binance y el gestor de modelos de un proceso worker."""
+    global _worker_binance, _worker_model_manager
+    _worker_binance = BinanceConnector(testnet=True)
+    _worker_binance.connect()
+    # Los workers terminan con os._exit (sin atexit): Finalize sí se ejecuta
+    mp_util.Finalize(None, _worker_binance.disconnect, exitpriority=10)
+    _worker_model_manager = ModelManager(logger)
+
+def _get_worker_model(model_name):
+    """Carga (una vez por proceso) el modelo indicado."""
+    model = _worker_models.get(model_name)
+    if model is None:
+        model = _worker_model_manager.load_model(model_name)
+        _worker_models[model_name] = model
+    return model
+
+# Caché de velas históricas: en memoria y en disco (parquet) entre ejecuciones.
+# Las velas se descargan una vez por símbolo en el proceso principal y se
+# entregan a los workers, que no acceden a la caché
+KLINES_CACHE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), ".cache", "klines")
+# Los archivos más antiguos se eliminan (se crea uno nuevo por símbolo cada hora)
+KLINES_CACHE_MAX_AGE = 7 * 24 * 3600
+_klines_cache = {}
+
+def _klines_cache_path(symbol, interval, start_ms, end_ms):
+    return os.path.join(KLINES_CACHE_DIR, f"{symbol.replace('/', '')}_{interval}_{start_ms}_{end_ms}.parquet")
+
+def prune_klines_cache(max_age=KLINES_CACHE_MAX_AGE):
+    """Elimina de la caché en disco los archivos de velas con más de max_age segundos."""
+    cutoff = time.time() - max_age
+    try:
+        entries = list(os.scandir(KLINES_CACHE_DIR))
+    except FileNotFoundError:
+        return
+    for entry in entries:
+        try:
+            if entry.is_file() and entry.stat().st_mtime < cutoff:
+                os.remove(entry.path)
+        except OSError:
+            pass
+
+def get_historical_data_cached(binance, symbol, interval, start_ms, end_ms):
+    """
+    Devuelve las velas cerradas de (symbol, interval, start_ms, end_ms) como
+    DataFrame, descargándolas de Binance solo si no están en caché.
+    """
+    key = (symbol, interval, start_ms, end_ms)
+    data = _klines_cache.get(key)
+    if data is not None:
+        return data
+    
+    path = _klines_cache_path(*key)
+    try:
+        data = pd.read_parquet(path)
+    except Exception:
+        data = None
+    
+    if data is None:
+        # El conector ya devuelve un DataFrame tipado por columnas
+        data = binance.get_historical_data(
+            symbol=symbol,
+            interval=interval,
+            start_time=start_ms,
+            end_time=end_ms
+        )
+        # La vela que aún no ha cerrado cambiará: no se usa ni se guarda
+        if not data.empty:
+            data = data[data['close_time'].to_numpy() < int(time.time() * 1000)].reset_index(drop=True)
+        if not data.empty:
+            try:
+                os.makedirs(KLINES_CACHE_DIR, exist_ok=True)
+                tmp_path = f"{path}.{os.getpid()}.tmp"
+                data.to_parquet(tmp_path, index=False)
+                os.replace(tmp_path, path)
+            except Exception as e:
+                # Sin pyarrow/fastparquet la caché queda solo en memoria
+                logger.debug("No se pudo escribir la caché de velas %s: %s", path, e)
     
-    # Inicializar componentes
+    _klines_cache[key] = data
+    return data
+
+def prefetch_historical_data(symbols, interval, start_ms, end_ms):
+    """
+    Descarga (o lee de caché) las velas de cada símbolo una sola vez, en
+    paralelo, antes de repartir las tareas entre procesos.
+    Devuelve {símbolo: DataFrame}.
+    """
+    prune_klines_cache()
     binance = BinanceConnector(testnet=True)
     binance.connect()
+    try:
+        with ThreadPoolExecutor(max_workers=len(symbols)) as executor:
+            frames = executor.map(
+                lambda symbol: get_historical_data_cached(binance, symbol, interval, start_ms, end_ms),
+                symbols
+            )
+            return dict(zip(symbols, frames))
+    finally:
+        binance.disconnect()
+
+def _evaluate_model_symbol(model_name, symbol, data, periods):
+    """
+    Evalúa un modelo sobre un símbolo en todos los periodos.
+    Los periodos comparten fecha de fin, así que los más cortos son sufijos del
+    más largo: data cubre la ventana completa, se predice una sola vez sobre
+    ella y cada periodo se evalúa sobre su tramo.
+    Se ejecuta en un proceso worker; devuelve [(clave, métricas), ...].
+    """
+    model = _get_worker_model(model_name)
+    
+    # Crear indicadores y procesamiento específicos para este modelo
+    processed_data = prepare_data_for_model(data, model_name)
+    
+    # Dividir en features y target
+    features = processed_data.drop(columns=['target'])
+    target = processed_data['target'].to_numpy()
     
-    model_manager = ModelManager(logger)
+    # Una única inferencia sobre la ventana completa
+    predictions = np.asarray(model.predict(features))
+    open_times = processed_data['open_time'].to_numpy()
     
-    # Cargar modelos disponibles
-    available_models = ["lstm", "transformer", "baseline"]
-    models = {}
-    for model_name in available_models:
+    # Crear estrategia basada en este modelo para backtest
+    strategy = create_strategy_from_model(model, model_name)
+    backtest_engine = BacktestingEngine({"data_service": _worker_binance})
+    
+    results = []
+    for period_name, start, end, start_ms, end_ms in periods:
+        # Tramo del periodo dentro de la ventana completa (open_time está ordenado)
+        start_idx = int(open_times.searchsorted(start_ms))
+        end_idx = int(open_times.searchsorted(end_ms, side="right"))
+        
+        # Evaluar métricas directas del modelo
+        metrics = calculate_metrics(predictions[start_idx:end_idx], target[start_idx:end_idx])
+        
+        # Ejecutar backtest
+        backtest_results = backtest_engine.run_backtest(
+            strategy=strategy,
+            start_date=start.strftime("%Y-%m-%d"),
+            end_date=end.strftime("%Y-%m-%d"),
+            symbol=symbol
+        )
+        
+        # Combinar métricas
+        combined_metrics = {
+            **metrics,
+            "return": backtest_results["final_balance"] / backtest_results["initial_balance"] - 1,
+            "win_rate": backtest_results["win_rate"],
+            "max_drawdown": backtest_results["max_drawdown"],
+            "sharpe_ratio": backtest_results["sharpe_ratio"],
+            "profit_factor": backtest_results["profit_factor"],
+            "trade_count": len(backtest_results["trades"])
+        }
+        results.append((f"{symbol}_{period_name}", combined_metrics))
+    
+    return results
+
+def _model_name(entry):
+    """Normaliza una entrada de list_available_models (nombre, archivo o dict) a su nombre."""
+    if isinstance(entry, dict):
+        entry = entry.get("name") or entry.get("model_name") or entry.get("id") or ""
+    name = os.path.basename(str(entry))
+    if name.endswith(MODEL_FILE_SUFFIXES):
+        name = name.rsplit(".", 1)[0]
+    return name
+
+def discover_models(models_dir=MODELS_DIR):
+    """
+    Devuelve los modelos de AVAILABLE_MODELS que existen, sin cargarlos.
+    Usa ModelManager.list_available_models() si está disponible y, si no,
+    los archivos de models_dir. Si ninguna fuente informa de nada, devuelve
+    todos los candidatos y cada worker comprueba el suyo al cargarlo.
+    """
+    names = set()
+    try:
+        list_models = getattr(ModelManager(logger), "list_available_models", None)
+        if list_models is not None:
+            names.update(_model_name(entry) for entry in list_models() or ())
+    except Exception as e:
+        logger.warning("No se pudieron listar los modelos disponibles: %s", e)
+    
+    if not names:
         try:
-            model = model_manager.load_model(model_name)
-            models[model_name] = model
-            logger.info(f"Modelo {model_name} cargado correctamente")
-        except Exception as e:
-            logger.warning(f"No se pudo cargar modelo {model_name}: {e}")
+            with os.scandir(models_dir) as entries:
+                names.update(_model_name(entry.name) for entry in entries
+                             if entry.name.endswith(MODEL_FILE_SUFFIXES) and entry.is_file())
+        except FileNotFoundError:
+            pass
+    
+    if not names:
+        logger.warning("No se pudo determinar qué modelos existen; se intentará cargar %s en los workers",
+                       ", ".join(AVAILABLE_MODELS))
+        return list(AVAILABLE_MODELS)
+    
+    models = []
+    for model_name in AVAILABLE_MODELS:
+        if model_name in names:
+            models.append(model_name)
+            logger.info("Modelo %s disponible", model_name)
+        else:
+            logger.warning("Modelo %s no disponible", model_name)
+    return models
+
+def run_model_evaluation(max_workers=None):
+    """
+    Ejecuta una evaluación completa de modelos.
+    Cada combinación (modelo, símbolo) es independiente y se evalúa en un
+    proceso distinto, con todos los periodos a partir de una sola predicción.
+    """
+    logger.info("Iniciando evaluación de modelos")
+    
+    # Comprobar qué modelos están disponibles sin cargarlos: solo los
+    # workers cargan los modelos que evalúan
+    models = discover_models()
+    if not models:
+        logger.warning("No hay modelos disponibles para evaluar (encontrados: ninguno de %s)",
+                       ", ".join(AVAILABLE_MODELS))
+        return
     
     # Definir períodos de evaluación
-    end_date = datetime.now()
+    # Se redondea a la hora para que la caché de velas se reutilice entre ejecuciones
+    end_date = datetime.now().replace(minute=0, second=0, microsecond=0)
+    # Los timestamps en ms se calculan una vez y viajan con cada periodo
     periods = [
-        ("1 semana", end_date - timedelta(days=7), end_date),
-        ("1 mes", end_date - timedelta(days=30), end_date),
-        ("3 meses", end_date - timedelta(days=90), end_date),
+        (period_name, start, end, int(start.timestamp() * 1000), int(end.timestamp() * 1000))
+        for period_name, start, end in [
+            ("1 semana", end_date - timedelta(days=7), end_date),
+            ("1 mes", end_date - timedelta(days=30), end_date),
+            ("3 meses", end_date - timedelta(days=90), end_date),
+        ]
     ]
     
     # Símbolos a evaluar
@@ -46,92 +289,122 @@ def run_model_evaluation():
     # Métricas por modelo
     model_metrics = {model_name: {} for model_name in models}
     
-    # Evaluar cada combinación
-    for symbol in symbols:
-        for period_name, start, end in periods:
-            logger.info(f"Evaluando {symbol} para {period_name}")
-            
-            # Obtener datos históricos
-            data = binance.get_historical_data(
-                symbol=symbol,
-                interval="1h",
-                start_time=int(start.timestamp() * 1000),
-                end_time=int(end.timestamp() * 1000)
-            )
+    # Velas de la ventana más amplia, descargadas una vez por símbolo y
+    # compartidas por todos los modelos
+    full_start_ms = min(start_ms for _, _, _, start_ms, _ in periods)
+    full_end_ms = max(end_ms for _, _, _, _, end_ms in periods)
+    historical_data = prefetch_historical_data(symbols, "1h", full_start_ms, full_end_ms)
+    
+    # Evaluar cada combinación (modelo, símbolo) en paralelo; los periodos
+    # se evalúan juntos dentro de cada tarea
+    tasks = [(model_name, symbol) for symbol, model_name in product(symbols, models)]
+    
+    # spawn en lugar de fork: CUDA no funciona en hijos creados con fork
+    # y cada worker carga sus propios modelos
+    with ProcessPoolExecutor(
+        max_workers=min(max_workers or os.cpu_count(), len(tasks)),
+        mp_context=multiprocessing.get_context("spawn"),
+        initializer=_init_worker
+    ) as executor:
+        futures = {
+            executor.submit(_evaluate_model_symbol, model_name, symbol, historical_data[symbol], periods):
+                (model_name, symbol)
+            for model_name, symbol in tasks
+        }
+        completed = as_completed(futures)
+        if tqdm is not None:
+            completed = tqdm(completed, total=len(futures), desc="Evaluando modelos")
+        
+        for future in completed:
+            model_name, symbol = futures[future]
+            try:
+                results = future.result()
+            except Exception as e:
+                logger.error("Error evaluando %s en %s: %s", model_name, symbol, e)
+                continue
             
-            # Evaluar cada modelo
-            for model_name, model in models.items():
-                logger.info(f"Evaluando modelo {model_name}")
-                
-                # Crear indicadores y procesamiento específicos para este modelo
-                processed_data = prepare_data_for_model(data, model_name)
-                
-                # Dividir en features y target
-                features = processed_data.drop(columns=['target'])
-                target = processed_data['target']
-                
-                # Evaluar métricas directas del modelo
-                predictions = model.predict(features)
-                metrics = calculate_metrics(predictions, target.values)
-                
-                # Crear estrategia basada en este modelo para backtest
-                strategy = create_strategy_from_model(model, model_name)
-                
-                # Ejecutar backtest
-                backtest_engine = BacktestingEngine({"data_service": binance})
-                backtest_results = backtest_engine.run_backtest(
-                    strategy=strategy,
-                    start_date=start.strftime("%Y-%m-%d"),
-                    end_date=end.strftime("%Y-%m-%d"),
-                    symbol=symbol
-                )
-                
-                # Combinar métricas
-                combined_metrics = {
-                    **metrics,
-                    "return": backtest_results["final_balance"] / backtest_results["initial_balance"] - 1,
-                    "win_rate": backtest_results["win_rate"],
-                    "max_drawdown": backtest_results["max_drawdown"],
-                    "sharpe_ratio": backtest_results["sharpe_ratio"],
-                    "profit_factor": backtest_results["profit_factor"],
-                    "trade_count": len(backtest_results["trades"])
-                }
-                
-                # Guardar métricas
-                key = f"{symbol}_{period_name}"
+            # Guardar métricas
+            log_metrics = logger.isEnabledFor(logging.INFO)
+            for key, combined_metrics in results:
                 model_metrics[model_name][key] = combined_metrics
-                logger.info(f"Métricas para {model_name} en {symbol} ({period_name}): {combined_metrics}")
+                # Evita el repr del diccionario si INFO está filtrado
+                if log_metrics:
+                    logger.info("Métricas para %s en %s: %s", model_name, key, combined_metrics)
     
     # Generar reporte final
     generate_evaluation_report(model_metrics, symbols, periods)
     
-    # Desconectar
-    binance.disconnect()
     logger.info("Evaluación completada")
 
 def generate_evaluation_report(metrics, symbols, periods):
     """Genera un reporte completo de evaluación."""
-    report = []
-    for model_name, model_data in metrics.items():
-        for key, metric_data in model_data.items():
-            report.append({"model": model_name, "key": key, **metric_data})
+    report = [
+        {"model": model_name, "key": key, **metric_data}
+        for model_name, model_data in metrics.items()
+        for key, metric_data in model_data.items()
+    ]
     
-    df = pd.DataFrame(report)
-    report_path = "model_evaluation_report.csv"
-    df.to_csv(report_path, index=False)
-    logger.info(f"Reporte de evaluación generado: {report_path}")
+    if pa is not None:
+        # Parquet columnar con zstd: tipado y mucho más compacto que el CSV
+        report_path = "model_evaluation_report.parquet"
+        pq.write_table(pa.Table.from_pylist(report), report_path,
+                       compression="zstd", compression_level=3)
+    else:
+        report_path = "model_evaluation_report.csv"
+        pd.DataFrame(report).to_csv(report_path, index=False)
+    logger.info("Reporte de evaluación generado: %s", report_path)
 
 # Funciones auxiliares (implementación simplificada)
 def prepare_data_for_model(data, model_name):
     """Prepara datos para un modelo específico."""
     # Implementación real depende del modelo
-    data['target'] = data['close'].shift(-1)  # Ejemplo: predecir el próximo precio
-    return data.dropna()
+    # Ejemplo: predecir el próximo precio. Solo sobra la última fila, así que
+    # basta con recortarla en lugar de shift(-1) + dropna sobre todo el DataFrame
+    # (la copia evita modificar data, que puede venir de la caché compartida)
+    close = data['close'].to_numpy()
+    out = data.iloc[:-1].copy()
+    out['target'] = close[1:]
+    if model_name in FLOAT32_MODELS:
+        # Solo las columnas float64 (los timestamps int64 no caben en float32)
+        out = out.astype({c: np.float32 for c, dtype in out.dtypes.items()
+                          if c != 'target' and dtype == np.float64})
+    return out
+
+if njit is not None:
+    # Firmas explícitas: se compila al importar (no en la primera llamada) y los
+    # arrays C-contiguos permiten vectorizar la reducción. Incluyen las
+    # variantes de solo lectura que devuelve pandas con copy-on-write
+    _F8 = types.Array(types.float64, 1, 'C')
+    _F8_RO = types.Array(types.float64, 1, 'C', readonly=True)
+
+    @njit([types.UniTuple(types.float64, 2)(pred, actual)
+           for pred in (_F8, _F8_RO) for actual in (_F8, _F8_RO)],
+          cache=True, fastmath=True)
+    def _metrics_kernel(pred, actual):
+        """Acierto de dirección y MSE en una sola pasada, sin arrays temporales."""
+        n = pred.shape[0]
+        hits = 0
+        sse = 0.0
+        for i in range(n):
+            if (pred[i] > 0) == (actual[i] > 0):
+                hits += 1
+            d = pred[i] - actual[i]
+            sse += d * d
+        return hits / n, sse / n
+else:
+    def _metrics_kernel(pred, actual):
+        """Versión vectorizada con NumPy cuando numba no está instalado."""
+        n = pred.shape[0]
+        hits = np.count_nonzero((pred > 0) == (actual > 0))
+        diff = pred - actual
+        return hits / n, float(np.dot(diff, diff)) / n
 
 def calculate_metrics(predictions, actuals):
     """Calcula métricas de rendimiento."""
-    accuracy = sum((predictions > 0) == (actuals > 0)) / len(actuals)
-    mse = sum((predictions - actuals) ** 2) / len(actuals)
+    # ravel: los modelos tipo Keras devuelven predicciones con forma (n, 1)
+    pred = np.ascontiguousarray(predictions, dtype=np.float64).ravel()
+    act = np.ascontiguousarray(actuals, dtype=np.float64).ravel()
+    accuracy, mse = _metrics_kernel(pred, act)
     return {"accuracy": accuracy, "mse": mse}
 
 def create_strategy_from_model(model, model_name):
@@ -142,8 +415,9 @@ def create_strategy_from_model(model, model_name):
         
         def generate_signals(self, data):
             predictions = self.model.predict(data)
-            signals = pd.DataFrame({"signal": (predictions > 0).astype(int) - (predictions < 0).astype(int)})
-            return signals
+            # Una sola pasada: 1 compra, -1 venta, 0 neutral (int8 para el backtest)
+            signals = np.sign(np.asarray(predictions)).astype(np.int8)
+            return pd.DataFrame({"signal": signals})
     
     return ModelBasedStrategy(model)
 
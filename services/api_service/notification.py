@@ -1,11 +1,28 @@
 # Notificaciones (Telegram)
 
+import asyncio
+import json
 import logging
 import time
 from threading import Lock
 import requests
 from datetime import datetime
 
+try:
+    import aiohttp
+except ImportError:
+    aiohttp = None
+
+# orjson serializa varias veces más rápido que json; ambos devuelven bytes aquí
+try:
+    import orjson
+    _json_dumps = orjson.dumps
+except ImportError:
+    def _json_dumps(obj):
+        return json.dumps(obj).encode()
+
+_JSON_HEADERS = {"Content-Type": "application/json"}
+
 class NotificationService:
     def __init__(self, token="", chat_id="", enabled=False):
         """
@@ -20,6 +37,15 @@ class NotificationService:
         self.chat_id = chat_id
         self.enabled = enabled
 
+        # URL y sesión HTTP reutilizadas entre mensajes (keep-alive con api.telegram.org)
+        self._url = f"https://api.telegram.org/bot{token}/sendMessage"
+        self._session = requests.Session()
+        # Payload de Telegram reutilizado: en cada envío solo cambia "text"
+        self._payload = {"chat_id": chat_id, "text": "", "parse_mode": "HTML"}
+        self._payload_lock = Lock()
+        # Sesión aiohttp para los envíos asíncronos, creada bajo demanda
+        self._async_session = None
+
         # Inicialización si es necesario
         if self.enabled:
             self._init_telegram()
@@ -40,10 +66,9 @@ class NotificationService:
         
         # Implementación de ejemplo para Telegram
         if self.token and self.chat_id:
-            url = f"https://api.telegram.org/bot{self.token}/sendMessage"
             payload = {"chat_id": self.chat_id, "text": message}
             try:
-                response = requests.post(url, json=payload)
+                response = self._session.post(self._url, json=payload, timeout=5)
                 response.raise_for_status()
             except Exception as e:
                 print(f"Error enviando notificación: {e}")
@@ -63,6 +88,10 @@ class NotificationService:
         if not self.enabled:
             return
             
+        self._send_telegram_message(self._format_trade_message(trader_name, symbol, action, price, amount, pnl))
+
+    def _format_trade_message(self, trader_name, symbol, action, price, amount=None, pnl=None):
+        """Compone el texto de una notificación de operación."""
         message = f"🤖 {trader_name} - {action} {symbol}\n"
         message += f"💲 Precio: {price:.2f}\n"
         
@@ -74,8 +103,7 @@ class NotificationService:
             message += f"{emoji} PnL: {pnl:.2f}%\n"
             
         message += f"⏱️ {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}"
-        
-        self._send_telegram_message(message)
+        return message
         
     def _send_telegram_message(self, message):
         """Envía mensaje a través de Telegram"""
@@ -83,13 +111,79 @@ class NotificationService:
             return
             
         try:
-            url = f"https://api.telegram.org/bot{self.token}/sendMessage"
+            # El lock protege el payload compartido cuando se envía desde varios hilos
+            with self._payload_lock:
+                self._payload["text"] = message
+                body = _json_dumps(self._payload)
+            response = self._session.post(self._url, data=body, headers=_JSON_HEADERS, timeout=5)
+            response.raise_for_status()
+        except Exception as e:
+            logging.error(f"Error enviando notificación Telegram: {e}")
+
+    async def _get_async_session(self):
+        """Devuelve la sesión aiohttp, creándola en el primer uso."""
+        if self._async_session is None or self._async_session.closed:
+            self._async_session = aiohttp.ClientSession(timeout=aiohttp.ClientTimeout(total=5))
+        return self._async_session
+
+    async def send_trade_notification_async(self, trader_name, symbol, action, price, amount=None, pnl=None):
+        """
+        Versión asíncrona de send_trade_notification.
+        Sin aiohttp instalado, el envío síncrono se ejecuta en un hilo.
+        """
+        if not self.enabled:
+            return
+        
+        message = self._format_trade_message(trader_name, symbol, action, price, amount, pnl)
+        if aiohttp is None:
+            await asyncio.get_running_loop().run_in_executor(None, self._send_telegram_message, message)
+            return
+        
+        try:
             payload = {
                 "chat_id": self.chat_id,
                 "text": message,
                 "parse_mode": "HTML"
             }
-            response = requests.post(url, json=payload)
-            response.raise_for_status()
+            session = await self._get_async_session()
+            async with session.post(self._url, data=_json_dumps(payload), headers=_JSON_HEADERS) as response:
+                response.raise_for_status()
+                await response.read()
         except Exception as e:
             logging.error(f"Error enviando notificación Telegram: {e}")
+
+    def send_trade_notifications(self, notifications):
+        """
+        Envía varias notificaciones de operaciones desde código síncrono.
+        Reutiliza la sesión requests compartida (keep-alive) en lugar de crear
+        un bucle de eventos, así que puede llamarse también desde un bucle activo.
+        
+        Args:
+            notifications: Iterable de diccionarios con los argumentos de
+                send_trade_notification (trader_name, symbol, action, price, ...)
+        """
+        for n in notifications:
+            self.send_trade_notification(**n)
+
+    async def send_trade_notifications_async(self, notifications):
+        """
+        Envía varias notificaciones de operaciones en paralelo.
+        
+        Args:
+            notifications: Iterable de diccionarios con los argumentos de
+                send_trade_notification (trader_name, symbol, action, price, ...)
+        """
+        await asyncio.gather(*(self.send_trade_notification_async(**n) for n in notifications))
+
+    async def aclose(self):
+        """
+        Cierra la sesión aiohttp si existe. Debe llamarse desde el mismo bucle
+        de eventos que usó los envíos asíncronos.
+        """
+        if self._async_session is not None:
+            await self._async_session.close()
+            self._async_session = None
+
+    def close(self):
+        """Cierra la sesión HTTP."""
+        self._session.close()
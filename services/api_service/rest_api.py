@@ -5,7 +5,10 @@ from fastapi.security import HTTPBasic, HTTPBasicCredentials
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse
 from pydantic import BaseModel
+from collections import defaultdict, deque
+import hmac
 import logging
+import os
 import time
 
 # Initialize FastAPI app
@@ -28,7 +31,8 @@ app.add_middleware(
 
 # Rate limiting (simple implementation)
 RATE_LIMIT = 10  # Max requests per minute
-request_counts = {}
+# Timestamps of the last RATE_LIMIT requests per client, oldest first
+request_counts = defaultdict(lambda: deque(maxlen=RATE_LIMIT))
 
 # Models
 class TraderControlRequest(BaseModel):
@@ -39,25 +43,30 @@ class WebhookEvent(BaseModel):
     event_type: str
     payload: dict
 
+# Valid credentials, read once at import
+_USER = os.environ.get("API_USER", "admin").encode()
+_PASS = os.environ.get("API_PASS", "password123").encode()
+
 # Dependency for authentication
 def authenticate(credentials: HTTPBasicCredentials = Depends(security)):
-    valid_username = "admin"
-    valid_password = "password123"
-    if credentials.username != valid_username or credentials.password != valid_password:
+    # Constant-time comparison; bitwise & so both checks always run
+    valid = hmac.compare_digest(credentials.username.encode(), _USER) & \
+        hmac.compare_digest(credentials.password.encode(), _PASS)
+    if not valid:
         raise HTTPException(status_code=401, detail="Invalid credentials")
     return credentials.username
 
 # Middleware for rate limiting
 @app.middleware("http")
 async def rate_limiter(request: Request, call_next):
-    client_ip = request.client.host
+    timestamps = request_counts[request.client.host]
     current_time = time.time()
-    if client_ip not in request_counts:
-        request_counts[client_ip] = []
-    request_counts[client_ip] = [t for t in request_counts[client_ip] if current_time - t < 60]
-    if len(request_counts[client_ip]) >= RATE_LIMIT:
+    # Expire only from the head: timestamps are appended in order
+    while timestamps and current_time - timestamps[0] >= 60:
+        timestamps.popleft()
+    if len(timestamps) >= RATE_LIMIT:
         return JSONResponse(status_code=429, content={"detail": "Rate limit exceeded"})
-    request_counts[client_ip].append(current_time)
+    timestamps.append(current_time)
     return await call_next(request)
 
 # Endpoints
@@ -1,9 +1,55 @@
 import os
 import logging
+import numpy as np
+import pandas as pd
 from binance.client import Client  # Correct import for Binance API client
 
 logger = logging.getLogger("BinanceConnector")
 
+# Columnas de las velas de Binance que se conservan, con su posición y tipo
+KLINE_COLUMNS = (
+    ("open_time", 0, np.int64),
+    ("open", 1, np.float64),
+    ("high", 2, np.float64),
+    ("low", 3, np.float64),
+    ("close", 4, np.float64),
+    ("volume", 5, np.float64),
+    ("close_time", 6, np.int64),
+)
+
+# Milisegundos por unidad de intervalo de Binance ("1m", "4h", "1d", "1w")
+INTERVAL_UNIT_MS = {"m": 60_000, "h": 3_600_000, "d": 86_400_000, "w": 604_800_000}
+
+def estimate_kline_rows(interval, start_time, end_time):
+    """Número de velas esperado entre start_time y end_time (1000 si no se puede estimar)."""
+    try:
+        step = int(interval[:-1]) * INTERVAL_UNIT_MS[interval[-1]]
+        return max(int((end_time - start_time) // step) + 1, 1)
+    except (ValueError, KeyError, TypeError, IndexError):
+        return 1000
+
+def klines_to_frame(klines, size_hint=0):
+    """
+    Vuelca las velas de Binance (lista o generador) en columnas NumPy
+    preasignadas y devuelve un DataFrame tipado.
+    La capacidad se duplica si la estimación se queda corta.
+    """
+    capacity = max(size_hint, 0)
+    columns = [np.empty(capacity, dtype=dtype) for _, _, dtype in KLINE_COLUMNS]
+    fields = [(idx, float if dtype is np.float64 else int) for _, idx, dtype in KLINE_COLUMNS]
+
+    n = 0
+    for kline in klines:
+        if n == capacity:
+            capacity = max(2 * capacity, 1000)
+            columns = [np.concatenate((column, np.empty(capacity - n, dtype=column.dtype)))
+                       for column in columns]
+        for column, (idx, cast) in zip(columns, fields):
+            column[n] = cast(kline[idx])
+        n += 1
+
+    return pd.DataFrame({name: column[:n] for (name, _, _), column in zip(KLINE_COLUMNS, columns)})
+
 class BinanceConnector:
     def __init__(self, api_key: str = "", api_secret: str = "", testnet: bool = True):
         """
@@ -53,22 +99,13 @@ class BinanceConnector:
             end_time: Timestamp de fin en milisegundos
         
         Returns:
-            Lista de datos históricos.
+            DataFrame con columnas open_time, open, high, low, close, volume y
+            close_time (vacío si hay error).
         """
         try:
-            klines = self.client.get_historical_klines(symbol, interval, start_time, end_time)
-            data = []
-            for kline in klines:
-                data.append({
-                    "open_time": kline[0],
-                    "open": float(kline[1]),
-                    "high": float(kline[2]),
-                    "low": float(kline[3]),
-                    "close": float(kline[4]),
-                    "volume": float(kline[5]),
-                    "close_time": kline[6]
-                })
-            return data
+            # El generador pide las velas por páginas: no se materializa la lista completa
+            klines = self.client.get_historical_klines_generator(symbol, interval, start_time, end_time)
+            return klines_to_frame(klines, estimate_kline_rows(interval, start_time, end_time))
         except Exception as e:
             logger.error(f"Error al obtener datos históricos de Binance: {e}")
-            return []
+            return klines_to_frame([])
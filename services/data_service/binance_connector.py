@@ -7,21 +7,38 @@ from binance.websockets import BinanceSocketManager
 from binance.exceptions import BinanceAPIException, BinanceRequestException
 import time
 
+from services.binance_connector import klines_to_frame, estimate_kline_rows
+
 class BinanceConnector:
-    def __init__(self, api_key="", api_secret="", testnet=True):
+    def __init__(self, api_key="", api_secret="", testnet=True, session=None):
         """
         Inicializa el conector de Binance.
 
         :param api_key: Clave de API de Binance.
         :param api_secret: Clave secreta de API de Binance.
         :param testnet: Indica si se debe usar el entorno de prueba de Binance.
+        :param session: requests.Session compartida cuyo pool de conexiones
+                        (HTTPAdapter) reutiliza el cliente. Sus cabeceras no se
+                        modifican. Si es None, el cliente usa su propio pool.
         """
         self.api_key = api_key
         self.api_secret = api_secret
         self.testnet = testnet
+        self.session = session
         self.client = None
         self.logger = logging.getLogger("BinanceConnector")
 
+    def _create_client(self):
+        """Crea el cliente de Binance reutilizando el pool de conexiones compartido si existe."""
+        client = Client(self.api_key, self.api_secret)
+        if self.testnet:
+            client.API_URL = 'https://testnet.binance.vision/api'
+        if self.session is not None:
+            # Solo se comparte el adapter (pool de conexiones): la API key queda
+            # en las cabeceras de la sesión propia del cliente y no en la compartida
+            client.session.mount("https://", self.session.get_adapter("https://"))
+        return client
+
     def connect(self):
         """
         Intenta conectar al servidor de Binance y verifica la conexión.
@@ -30,9 +47,7 @@ class BinanceConnector:
         """
         try:
             # Inicializa el cliente
-            self.client = Client(self.api_key, self.api_secret)
-            if self.testnet:
-                self.client.API_URL = 'https://testnet.binance.vision/api'
+            self.client = self._create_client()
 
             # Verifica la conexión
             server_time = self.client.get_server_time()
@@ -54,6 +69,25 @@ class BinanceConnector:
                 self.logger.error(f"Error fetching OHLCV data: {e}")
                 return None
 
+    def get_historical_data(self, symbol, interval, start_time, end_time):
+        """
+        Obtiene velas históricas como DataFrame por columnas (open_time, open,
+        high, low, close, volume, close_time), sin pasar por listas de filas.
+
+        :param symbol: Par de mercado (por ejemplo, "BTC/USDT").
+        :param interval: Intervalo de las velas (por ejemplo, "1h").
+        :param start_time: Timestamp de inicio en milisegundos.
+        :param end_time: Timestamp de fin en milisegundos.
+        :return: DataFrame tipado (vacío si hay error).
+        """
+        try:
+            klines = self.client.get_historical_klines_generator(
+                symbol.replace("/", ""), interval, start_time, end_time)
+            return klines_to_frame(klines, estimate_kline_rows(interval, start_time, end_time))
+        except Exception as e:
+            self.logger.error(f"Error obteniendo datos históricos: {e}")
+            return klines_to_frame([])
+
     def get_account_balance(self):
         with threading.Lock():
             try:
@@ -118,9 +152,7 @@ class BinanceConnector:
     def reconnect(self):
         self.logger.info("Reconnecting to Binance...")
         time.sleep(5)
-        self.client = Client(self.api_key, self.api_secret)
-        if self.testnet:
-            self.client.API_URL = 'https://testnet.binance.vision/api'
+        self.client = self._create_client()
         if hasattr(self, 'bsm') and self.bsm:
             self.bsm.close()
             self.bsm = None
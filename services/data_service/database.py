@@ -1,6 +1,7 @@
 # Almacenamiento de datos
 import sqlite3
-from contextlib import closing
+import threading
+from contextlib import closing, contextmanager
 import os
 import pandas as pd
 from datetime import datetime, timedelta
@@ -12,13 +13,44 @@ class Database:
         :param db_path: Path to the SQLite database file.
         """
         self.db_path = db_path
+        self._lock = threading.Lock()
+        # Single shared connection: WAL lets readers run alongside the trader's
+        # writes and keeps the page cache warm across ticks.
+        self.conn = sqlite3.connect(db_path, check_same_thread=False)
+        self.conn.executescript("""
+            PRAGMA journal_mode=WAL;
+            PRAGMA synchronous=NORMAL;
+            PRAGMA temp_store=MEMORY;
+            PRAGMA cache_size=-65536;
+        """)
         self._initialize_database()
 
+    @contextmanager
+    def _connection(self):
+        """
+        Yield the shared connection inside a transaction (commit on success,
+        rollback on error), serialized across threads.
+        """
+        with self._lock:
+            if self.conn is None:
+                raise sqlite3.ProgrammingError("Database connection is closed")
+            with self.conn:
+                yield self.conn
+
+    def close(self):
+        """
+        Close the shared connection. Safe to call more than once.
+        """
+        with self._lock:
+            if self.conn is not None:
+                self.conn.close()
+                self.conn = None
+
     def _initialize_database(self):
         """
         Create necessary tables if they do not exist.
         """
-        with sqlite3.connect(self.db_path) as conn:
+        with self._connection() as conn:
             cursor = conn.cursor()
             # Table for historical market data (OHLCV)
             cursor.execute("""
@@ -83,7 +115,7 @@ class Database:
         :param symbol: Trading pair (e.g., BTCUSDT).
         :param data: Pandas DataFrame with columns ['timestamp', 'open', 'high', 'low', 'close', 'volume'].
         """
-        with sqlite3.connect(self.db_path) as conn:
+        with self._connection() as conn:
             data['symbol'] = symbol
             data.to_sql('market_data', conn, if_exists='append', index=False)
 
@@ -101,7 +133,7 @@ class Database:
             WHERE symbol = ? AND timestamp BETWEEN ? AND ?
             ORDER BY timestamp ASC
         """
-        with sqlite3.connect(self.db_path) as conn:
+        with self._connection() as conn:
             return pd.read_sql_query(query, conn, params=(symbol, start_time, end_time))
 
     def log_trade(self, symbol, side, quantity, price, pnl, timestamp=None):
@@ -115,7 +147,7 @@ class Database:
         :param timestamp: Timestamp of the trade (default: current time).
         """
         timestamp = timestamp or datetime.utcnow()
-        with sqlite3.connect(self.db_path) as conn:
+        with self._connection() as conn:
             conn.execute("""
                 INSERT INTO trade_logs (symbol, side, quantity, price, pnl, timestamp)
                 VALUES (?, ?, ?, ?, ?, ?)
@@ -132,7 +164,7 @@ class Database:
         :param timestamp: Timestamp of the signal (default: current time).
         """
         timestamp = timestamp or datetime.utcnow()
-        with sqlite3.connect(self.db_path) as conn:
+        with self._connection() as conn:
             conn.execute("""
                 INSERT INTO signals (symbol, signal, confidence, stop_loss, take_profit, timestamp)
                 VALUES (?, ?, ?, ?, ?, ?)
@@ -146,7 +178,7 @@ class Database:
         :param timestamp: Timestamp of the state (default: current time).
         """
         timestamp = timestamp or datetime.utcnow()
-        with sqlite3.connect(self.db_path) as conn:
+        with self._connection() as conn:
             conn.execute("""
                 INSERT INTO model_states (model_name, state, timestamp)
                 VALUES (?, ?, ?)
@@ -165,7 +197,7 @@ class Database:
             ORDER BY timestamp DESC
             LIMIT 1
         """
-        with sqlite3.connect(self.db_path) as conn:
+        with self._connection() as conn:
             result = conn.execute(query, (model_name,)).fetchone()
             return result[0] if result else None
 
@@ -177,7 +209,7 @@ class Database:
         :param timestamp: Timestamp of the configuration (default: current time).
         """
         timestamp = timestamp or datetime.utcnow()
-        with sqlite3.connect(self.db_path) as conn:
+        with self._connection() as conn:
             conn.execute("""
                 INSERT INTO configurations (config_name, config_data, timestamp)
                 VALUES (?, ?, ?)
@@ -196,7 +228,7 @@ class Database:
             ORDER BY timestamp DESC
             LIMIT 1
         """
-        with sqlite3.connect(self.db_path) as conn:
+        with self._connection() as conn:
             result = conn.execute(query, (config_name,)).fetchone()
             return result[0] if result else None
 
@@ -206,7 +238,7 @@ class Database:
         :param retention_days: Number of days to retain data.
         """
         cutoff_date = datetime.utcnow() - timedelta(days=retention_days)
-        with sqlite3.connect(self.db_path) as conn:
+        with self._connection() as conn:
             conn.execute("""
                 DELETE FROM market_data
                 WHERE timestamp < ?
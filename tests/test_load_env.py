@@ -0,0 +1,29 @@
+from load_env import _parse_env_text
+
+def test_parse_env_text_matches_dotenv_forms():
+    text = "\n".join([
+        "# comentario",
+        "",
+        "BINANCE_API_KEY=abc123",
+        "export BINANCE_TESTNET=true",
+        "TRADING_MODE=paper # modo por defecto",
+        "DATABASE_PATH='data/trading.db'",
+        'TELEGRAM_TOKEN="12:ab#cd"',
+        "  SPACED = value  ",
+        "EMPTY=",
+        "HASH=a#b",
+    ])
+    env = _parse_env_text(text)
+    assert env == {
+        "BINANCE_API_KEY": "abc123",
+        "BINANCE_TESTNET": "true",
+        "TRADING_MODE": "paper",
+        "DATABASE_PATH": "data/trading.db",
+        "TELEGRAM_TOKEN": "12:ab#cd",
+        "SPACED": "value",
+        "EMPTY": "",
+        "HASH": "a#b",
+    }
+
+if __name__ == "__main__":
+    test_parse_env_text_matches_dotenv_forms()
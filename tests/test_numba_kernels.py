@@ -0,0 +1,98 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from core.features.technical_features import TechnicalFeatures
+
+def _readonly(values):
+    arr = np.asarray(values, dtype=np.float64)
+    arr.flags.writeable = False
+    return arr
+
+def _baseline_rsi(prices, window):
+    """Implementación NumPy original (np.convolve) como referencia."""
+    deltas = np.diff(prices)
+    finite = np.isfinite(deltas)
+    gains = np.where(finite & (deltas > 0), deltas, 0)
+    losses = np.where(finite & (deltas < 0), -deltas, 0)
+    avg_gain = np.convolve(gains, np.ones(window), 'valid') / window
+    avg_loss = np.convolve(losses, np.ones(window), 'valid') / window
+    rsi = 100 - (100 / (1 + avg_gain / (avg_loss + 1e-10)))
+    # Ventanas con alguna variación no finita: NaN
+    rsi[np.convolve(~finite, np.ones(window), 'valid') > 0] = np.nan
+    return np.concatenate((np.full(window - 1, np.nan), rsi))
+
+def _baseline_bollinger(prices, window, num_std):
+    """Implementación original (np.mean / np.std por ventana) como referencia."""
+    middle = np.array([np.mean(prices[i - window:i]) if i >= window else np.nan
+                       for i in range(1, len(prices) + 1)])
+    std = np.array([np.std(prices[i - window:i]) if i >= window else np.nan
+                    for i in range(1, len(prices) + 1)])
+    return middle + std * num_std, middle, middle - std * num_std
+
+def _random_prices(n=300, seed=0):
+    rng = np.random.default_rng(seed)
+    return 100 + np.cumsum(rng.normal(size=n))
+
+def test_indicators_match_baseline_on_random_data():
+    indicators = TechnicalFeatures()
+    prices = _random_prices()
+
+    for data in (prices, pd.Series(prices), _readonly(prices)):
+        np.testing.assert_allclose(indicators.calculate_rsi(data, window=14),
+                                   _baseline_rsi(prices, 14), equal_nan=True)
+
+        bands = indicators.calculate_bollinger(data, window=20, num_std=2)
+        for band, expected in zip(bands, _baseline_bollinger(prices, 20, 2)):
+            np.testing.assert_allclose(band, expected, equal_nan=True)
+
+def test_rsi_non_finite_prices_only_affect_their_windows():
+    indicators = TechnicalFeatures()
+    prices = _random_prices()
+    prices[100] = np.nan
+    prices[200] = np.inf
+
+    rsi = indicators.calculate_rsi(prices, window=14)
+    expected = _baseline_rsi(prices, 14)
+    np.testing.assert_allclose(rsi, expected, equal_nan=True)
+    # Las ventanas posteriores vuelven a tener valores válidos
+    assert np.isfinite(rsi[130:190]).all()
+    assert np.isfinite(rsi[230:]).all()
+
+@pytest.mark.parametrize("as_array", [np.ascontiguousarray, _readonly], ids=["contiguous", "readonly"])
+def test_indicators_with_non_finite_prices_match_baseline(as_array):
+    indicators = TechnicalFeatures()
+    prices = _random_prices()
+    prices[100] = np.nan
+    prices[200] = np.inf
+    data = as_array(prices)
+
+    np.testing.assert_allclose(indicators.calculate_rsi(data, window=14),
+                               _baseline_rsi(prices, 14), equal_nan=True)
+
+    with np.errstate(invalid="ignore"):
+        expected_bands = _baseline_bollinger(prices, 20, 2)
+        bands = indicators.calculate_bollinger(data, window=20, num_std=2)
+    for band, expected in zip(bands, expected_bands):
+        np.testing.assert_allclose(band, expected, equal_nan=True)
+
+def test_calculate_metrics_accepts_readonly_and_column_predictions():
+    # model_evaluation importa los modelos y el conector de Binance
+    calculate_metrics = pytest.importorskip("model_evaluation").calculate_metrics
+
+    actuals = _readonly([1.0, -2.0, 3.0, -4.0])
+    predictions = np.array([[1.5], [-1.0], [-3.0], [-4.0]])  # salida tipo Keras (n, 1)
+
+    metrics = calculate_metrics(predictions, actuals)
+    assert metrics["accuracy"] == 0.75
+    assert np.isclose(metrics["mse"], (0.25 + 1.0 + 36.0 + 0.0) / 4)
+
+    metrics = calculate_metrics(pd.Series(predictions.ravel()), pd.Series(actuals).to_numpy())
+    assert metrics["accuracy"] == 0.75
+
+if __name__ == "__main__":
+    test_indicators_match_baseline_on_random_data()
+    test_rsi_non_finite_prices_only_affect_their_windows()
+    test_indicators_with_non_finite_prices_match_baseline(np.ascontiguousarray)
+    test_indicators_with_non_finite_prices_match_baseline(_readonly)
+    test_calculate_metrics_accepts_readonly_and_column_predictions()